@@ -18,92 +18,122 @@ Exemplos:
 """
 
 import argparse
+import asyncio
 import os
+import re
 import sys
-import time
-from typing import List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
 
 from pyevolutionapi import EvolutionClient
 
+# Padrões de nomes de teste ("qrcode-test", "edge-test" etc. já casam com "test")
+_TEST_RE = re.compile(r"test|pytest|debug|temp|demo|example|sample|trial", re.IGNORECASE)
 
-def list_instances(client: EvolutionClient) -> List[dict]:
-    """Lista todas as instâncias na Evolution API."""
-    try:
-        instances = client.instance.fetch_instances()
-
-        instance_data = []
-        for i, instance in enumerate(instances):
-            data = {
-                "index": i + 1,
-                "id": instance.id,
-                "name": instance.name or "No Name",
-                "status": instance.status,
-                "state": instance.state,
-                "profile_name": instance.profile_name or "No Profile",
-                "integration": instance.integration,
-                "created_at": instance.created_at,
-            }
-            instance_data.append(data)
-
-        return instance_data
+# Respostas aceitas como confirmação
+_CONFIRM_YES = frozenset({"y", "yes", "s", "sim"})
+
+# Colunas retornadas por list_instances
+_FIELDS = ("id", "name", "status", "state", "profile_name", "integration", "created_at")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Configuração da Evolution API lida do .env.integration."""
+
+    base_url: str
+    api_key: Optional[str]
+    timeout: float
+    rps: float
+
+
+@lru_cache(maxsize=None)
+def _settings() -> Settings:
+    """Carrega o .env.integration e lê a configuração uma única vez."""
+    load_dotenv(".env.integration")
+    return Settings(
+        base_url=os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080"),
+        api_key=os.getenv("EVOLUTION_API_KEY"),
+        timeout=30.0,
+        rps=float(os.getenv("EVOLUTION_RPS", "5")),
+    )
+
+
+def list_instances(client: EvolutionClient) -> Dict[str, list]:
+    """
+    Lista todas as instâncias na Evolution API.
+
+    Returns:
+        Dict[str, list]: Uma lista por campo ("id", "name", "status", ...), todas
+        com o mesmo tamanho, para que filtros leiam só as colunas que usam
+    """
+    columns: Dict[str, list] = {field: [] for field in _FIELDS}
 
+    try:
+        for instance in client.instance.iter_instances(trusted=True):
+            columns["id"].append(instance.id)
+            columns["name"].append(instance.name or "No Name")
+            columns["status"].append(instance.status)
+            columns["state"].append(instance.state)
+            columns["profile_name"].append(instance.profile_name or "No Profile")
+            columns["integration"].append(instance.integration)
+            columns["created_at"].append(instance.created_at)
     except Exception as e:
         print(f"❌ Erro ao listar instâncias: {e}")
-        return []
+        return {field: [] for field in _FIELDS}
+
+    return columns
 
 
 def is_test_instance(instance_id: str, name: str) -> bool:
     """Verifica se é uma instância de teste baseada no nome/ID."""
-    test_patterns = [
-        "test",
-        "pytest",
-        "debug",
-        "temp",
-        "demo",
-        "example",
-        "sample",
-        "trial",
-        "qrcode-test",
-        "connect-test",
-        "edge-test",
-    ]
-
-    check_strings = [instance_id or "", name or ""]
-
-    for check_str in check_strings:
-        if check_str:
-            check_lower = check_str.lower()
-            for pattern in test_patterns:
-                if pattern in check_lower:
-                    return True
-
-    return False
-
-
-def remove_instance(client: EvolutionClient, identifier: str) -> bool:
+    # O separador \x00 evita casamentos que atravessem os dois campos
+    return bool(_TEST_RE.search((instance_id or "") + "\x00" + (name or "")))
+
+
+async def _remove_many(client: EvolutionClient, ids: List[str], concurrency: int = 8) -> int:
     """
-    Remove uma instância específica.
+    Remove várias instâncias em paralelo.
+
+    A taxa de remoções por segundo vem de EVOLUTION_RPS (padrão: 5); respostas
+    429 com Retry-After são tratadas pelo próprio cliente.
 
     Args:
         client: Cliente da Evolution API
-        identifier: ID ou nome da instância
+        ids: IDs ou nomes das instâncias
+        concurrency: Número máximo de remoções simultâneas
 
     Returns:
-        bool: True se removida com sucesso
+        int: Quantidade de instâncias removidas com sucesso
     """
     try:
-        client.instance.delete(identifier)
-        print(f"✅ Removida: {identifier}")
-        return True
+        results = await client.instance.abulk_delete(
+            ids, concurrency=concurrency, rate=_settings().rps
+        )
+    finally:
+        await client.aclose()
+
+    removed = 0
+    for identifier, result in results.items():
+        if isinstance(result, BaseException):
+            print(f"❌ Erro ao remover {identifier}: {result}")
+        else:
+            print(f"✅ Removida: {identifier}")
+            removed += 1
+
+    return removed
 
-    except Exception as e:
-        print(f"❌ Erro ao remover {identifier}: {e}")
-        return False
 
+async def _ainput(prompt: str) -> str:
+    """Lê da entrada padrão sem bloquear o event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, input, prompt)
 
-def main():
+
+async def main():
     parser = argparse.ArgumentParser(
         description="Limpeza de instâncias da Evolution API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -141,17 +171,15 @@ Exemplos:
         return 1
 
     # Carrega configuração
-    load_dotenv(".env.integration")
-
-    api_key = os.getenv("EVOLUTION_API_KEY")
-    if not api_key:
+    settings = _settings()
+    if not settings.api_key:
         print("❌ EVOLUTION_API_KEY não configurado no .env.integration")
         return 1
 
     client = EvolutionClient(
-        base_url=os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080"),
-        api_key=api_key,
-        timeout=30.0,
+        base_url=settings.base_url,
+        api_key=settings.api_key,
+        timeout=settings.timeout,
     )
 
     print("🧹 LIMPEZA DE INSTÂNCIAS - EVOLUTION API")
@@ -160,26 +188,46 @@ Exemplos:
     # Lista instâncias
     print("📋 Carregando instâncias...")
     instances = list_instances(client)
+    ids, names = instances["id"], instances["name"]
 
-    if not instances:
+    if not ids:
         print("ℹ️ Nenhuma instância encontrada")
         return 0
 
+    # Índice por ID e nome para a verificação de existência do --remove
+    by_key = {}
+    for row, (instance_id, name) in enumerate(zip(ids, names)):
+        by_key[instance_id] = row
+        if name:
+            by_key[name] = row
+
+    # Marca instâncias de teste uma única vez
+    test_mask = [is_test_instance(instance_id, name) for instance_id, name in zip(ids, names)]
+
     # Ação: Listar
     if args.list:
-        print(f"\n📋 INSTÂNCIAS ENCONTRADAS ({len(instances)}):")
+        print(f"\n📋 INSTÂNCIAS ENCONTRADAS ({len(ids)}):")
         print("-" * 80)
 
-        for instance in instances:
-            test_flag = " [TESTE]" if is_test_instance(instance["id"], instance["name"]) else ""
-            print(f"{instance['index']:2}. {instance['id']}")
-            print(f"    Nome: {instance['name']}{test_flag}")
-            print(f"    Profile: {instance['profile_name']}")
-            print(f"    Status: {instance['status']} | State: {instance['state']}")
-            print(f"    Integration: {instance['integration']}")
-            if instance["created_at"]:
-                print(f"    Criado: {instance['created_at']}")
-            print()
+        # Monta a saída em um buffer e escreve em blocos, evitando um print por linha
+        buf = []
+        for row, instance_id in enumerate(ids):
+            test_flag = " [TESTE]" if test_mask[row] else ""
+            created_at = instances["created_at"][row]
+            buf.append(
+                f"{row + 1:2}. {instance_id}\n"
+                f"    Nome: {names[row]}{test_flag}\n"
+                f"    Profile: {instances['profile_name'][row]}\n"
+                f"    Status: {instances['status'][row]} | State: {instances['state'][row]}\n"
+                f"    Integration: {instances['integration'][row]}\n"
+                + (f"    Criado: {created_at}\n" if created_at else "")
+                + "\n"
+            )
+            if len(buf) >= 100:
+                sys.stdout.write("".join(buf))
+                buf.clear()
+
+        sys.stdout.write("".join(buf))
 
     # Ação: Remover específica
     elif args.remove:
@@ -187,18 +235,12 @@ Exemplos:
         print(f"🗑️ Removendo instância: {instance_id}")
 
         # Verifica se existe
-        found = False
-        for instance in instances:
-            if instance["id"] == instance_id or instance["name"] == instance_id:
-                found = True
-                break
-
-        if not found:
+        if instance_id not in by_key:
             print(f"⚠️ Instância '{instance_id}' não encontrada")
             print("💡 Use --list para ver instâncias disponíveis")
             return 1
 
-        if remove_instance(client, instance_id):
+        if await _remove_many(client, [instance_id]):
             print("✅ Instância removida com sucesso!")
         else:
             print("❌ Falha na remoção")
@@ -206,67 +248,59 @@ Exemplos:
 
     # Ação: Limpar instâncias de teste
     elif args.clean_test:
-        test_instances = [
-            instance for instance in instances if is_test_instance(instance["id"], instance["name"])
-        ]
+        test_rows = [row for row, is_test in enumerate(test_mask) if is_test]
 
-        if not test_instances:
+        if not test_rows:
             print("ℹ️ Nenhuma instância de teste encontrada")
             return 0
 
-        print(f"🧪 INSTÂNCIAS DE TESTE ENCONTRADAS ({len(test_instances)}):")
-        for instance in test_instances:
-            print(f"  - {instance['id']} ({instance['name']})")
+        print(f"🧪 INSTÂNCIAS DE TESTE ENCONTRADAS ({len(test_rows)}):")
+        for row in test_rows:
+            print(f"  - {ids[row]} ({names[row]})")
 
-        confirm = input(f"\n⚠️ Remover {len(test_instances)} instância(s) de teste? [y/N]: ")
+        confirm = await _ainput(f"\n⚠️ Remover {len(test_rows)} instância(s) de teste? [y/N]: ")
 
-        if confirm.lower() in ["y", "yes", "s", "sim"]:
-            removed = 0
-            for instance in test_instances:
-                if remove_instance(client, instance["id"]):
-                    removed += 1
-                time.sleep(0.5)  # Evita rate limiting
+        if confirm.strip().lower() in _CONFIRM_YES:
+            removed = await _remove_many(client, [ids[row] for row in test_rows])
 
-            print(f"\n✅ {removed}/{len(test_instances)} instâncias de teste removidas")
+            print(f"\n✅ {removed}/{len(test_rows)} instâncias de teste removidas")
         else:
             print("❌ Operação cancelada")
 
     # Ação: Limpar TODAS (perigoso!)
     elif args.confirm_clean_all:
-        print(f"⚠️ ATENÇÃO: REMOVER TODAS AS {len(instances)} INSTÂNCIAS!")
+        print(f"⚠️ ATENÇÃO: REMOVER TODAS AS {len(ids)} INSTÂNCIAS!")
         print("🚨 Esta operação é IRREVERSÍVEL!")
         print("🚨 Todas as instâncias da Evolution API serão PERDIDAS!")
 
-        for instance in instances[:5]:  # Mostra algumas
-            print(f"  - {instance['id']} ({instance['name']})")
+        for instance_id, name in zip(ids[:5], names[:5]):  # Mostra algumas
+            print(f"  - {instance_id} ({name})")
 
-        if len(instances) > 5:
-            print(f"  ... e mais {len(instances) - 5} instâncias")
+        if len(ids) > 5:
+            print(f"  ... e mais {len(ids) - 5} instâncias")
 
         print("\n" + "=" * 50)
-        confirm1 = input("Digite 'CONFIRMO' para continuar: ")
+        confirm1 = await _ainput("Digite 'CONFIRMO' para continuar: ")
 
         if confirm1 != "CONFIRMO":
             print("❌ Operação cancelada")
             return 0
 
-        confirm2 = input("Tem CERTEZA ABSOLUTA? Digite 'SIM REMOVER TODAS': ")
+        confirm2 = await _ainput("Tem CERTEZA ABSOLUTA? Digite 'SIM REMOVER TODAS': ")
 
         if confirm2 != "SIM REMOVER TODAS":
             print("❌ Operação cancelada")
             return 0
 
-        print(f"\n🗑️ Removendo {len(instances)} instâncias...")
-        removed = 0
+        # Uma entrada por instância; dict.fromkeys só remove IDs repetidos
+        unique_ids = list(dict.fromkeys(ids))
 
-        for instance in instances:
-            if remove_instance(client, instance["id"]):
-                removed += 1
-            time.sleep(0.5)  # Evita rate limiting
+        print(f"\n🗑️ Removendo {len(unique_ids)} instâncias...")
+        removed = await _remove_many(client, unique_ids)
 
-        print(f"\n💥 {removed}/{len(instances)} instâncias removidas")
+        print(f"\n💥 {removed}/{len(unique_ids)} instâncias removidas")
 
-        if removed == len(instances):
+        if removed == len(unique_ids):
             print("✅ Limpeza completa realizada!")
         else:
             print("⚠️ Algumas instâncias podem não ter sido removidas")
@@ -276,7 +310,7 @@ Exemplos:
 
 if __name__ == "__main__":
     try:
-        exit_code = main()
+        exit_code = asyncio.run(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n⚡ Operação interrompida pelo usuário")
@@ -3,7 +3,11 @@
 Script de debug para ver exatamente o que a Evolution API está retornando.
 """
 
+import operator
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -12,14 +16,33 @@ from pyevolutionapi import EvolutionClient
 # Carrega configuração
 load_dotenv(".env.integration")
 
+# Campos exibidos para cada instância, lidos de uma vez
+_FIELDS = operator.attrgetter(
+    "instance_name", "instance_id", "id", "status", "state", "name", "profile_name", "Setting"
+)
 
-def main():
-    client = EvolutionClient(
+
+@dataclass(frozen=True)
+class Settings:
+    """Configuração da Evolution API lida do ambiente."""
+
+    base_url: str
+    api_key: Optional[str]
+
+
+@lru_cache(maxsize=None)
+def _settings() -> Settings:
+    """Lê a configuração do ambiente uma única vez."""
+    return Settings(
         base_url=os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080"),
         api_key=os.getenv("EVOLUTION_API_KEY"),
-        debug=True,
     )
 
+
+def main():
+    settings = _settings()
+    client = EvolutionClient(base_url=settings.base_url, api_key=settings.api_key, debug=True)
+
     print("🔍 Debug da Evolution API\n")
 
     # 1. Criar instância de teste
@@ -52,32 +75,29 @@ def main():
 
         # 2. Buscar todas as instâncias
         print("\n📋 Buscando todas as instâncias...")
-        instances_list = client.instance.fetch_instances()
+        instances_list = client.instance.fetch_instances(trusted=True)
 
         print(f"Total encontradas: {len(instances_list)}")
 
         for i, instance in enumerate(instances_list):
+            iname, iid, i_id, status, state, name, profile, setting = _FIELDS(instance)
+
             print(f"\n--- Instância {i+1} ---")
             print(f"Type: {type(instance)}")
-            print(f"instance_name: {repr(instance.instance_name)}")
-            print(f"instance_id: {repr(instance.instance_id)}")
-            print(f"id: {repr(instance.id)}")
-            print(f"status: {repr(instance.status)}")
-            print(f"state: {repr(instance.state)}")
-            print(f"property .name: {repr(instance.name)}")
-            print(f"profile_name: {repr(instance.profile_name)}")
+            print(f"instance_name: {repr(iname)}")
+            print(f"instance_id: {repr(iid)}")
+            print(f"id: {repr(i_id)}")
+            print(f"status: {repr(status)}")
+            print(f"state: {repr(state)}")
+            print(f"property .name: {repr(name)}")
+            print(f"profile_name: {repr(profile)}")
 
             # Mostra campos da API real
-            if instance.Setting:
-                print(f"Setting: {instance.Setting}")
+            if setting:
+                print(f"Setting: {setting}")
 
             # Verifica se é nossa instância de teste
-            is_test = (
-                instance.instance_name == test_name
-                or instance.instance_id == test_name
-                or instance.id == test_name
-                or instance.name == test_name
-            )
+            is_test = test_name in (iname, iid, i_id, name)
 
             if is_test:
                 print("🎯 ESTA É NOSSA INSTÂNCIA DE TESTE!")
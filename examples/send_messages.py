@@ -11,71 +11,73 @@ This example demonstrates different types of messages:
 6. Stickers and reactions
 """
 
+import asyncio
 import os
 
 from pyevolutionapi import EvolutionClient
 
 
-def text_messages_example(client: EvolutionClient, instance: str, number: str):
+async def text_messages_example(client: EvolutionClient, instance: str, number: str):
     """Examples of sending text messages."""
     print("📝 Text Messages:")
 
-    # Simple text
-    response = client.messages.send_text(
-        instance=instance, number=number, text="Hello! This is a simple text message."
+    simple, formatted, mentions = await asyncio.gather(
+        # Simple text
+        client.messages.asend_text(
+            instance=instance, number=number, text="Hello! This is a simple text message."
+        ),
+        # Text with formatting
+        client.messages.asend_text(
+            instance=instance,
+            number=number,
+            text="*Bold text*, _italic text_, ~strikethrough~, ```code```",
+        ),
+        # Text with mentions
+        client.messages.asend_text(
+            instance=instance,
+            number=number,
+            text="Hello @everyone! This message mentions everyone.",
+            mentions_everyone=True,
+        ),
     )
-    print(f"  ✅ Simple text sent: {response.message_id}")
-
-    # Text with formatting
-    response = client.messages.send_text(
-        instance=instance,
-        number=number,
-        text="*Bold text*, _italic text_, ~strikethrough~, ```code```",
-    )
-    print(f"  ✅ Formatted text sent: {response.message_id}")
-
-    # Text with mentions
-    response = client.messages.send_text(
-        instance=instance,
-        number=number,
-        text="Hello @everyone! This message mentions everyone.",
-        mentions_everyone=True,
-    )
-    print(f"  ✅ Text with mentions sent: {response.message_id}")
+    print(f"  ✅ Simple text sent: {simple.message_id}")
+    print(f"  ✅ Formatted text sent: {formatted.message_id}")
+    print(f"  ✅ Text with mentions sent: {mentions.message_id}")
 
 
-def media_messages_example(client: EvolutionClient, instance: str, number: str):
+async def media_messages_example(client: EvolutionClient, instance: str, number: str):
     """Examples of sending media messages."""
     print("🖼️ Media Messages:")
 
-    # Send image
-    response = client.messages.send_media(
-        instance=instance,
-        number=number,
-        mediatype="image",
-        media="https://picsum.photos/400/300",
-        caption="This is a random image from Picsum! 📸",
-    )
-    print(f"  ✅ Image sent: {response.message_id}")
-
-    # Send document
-    response = client.messages.send_media(
-        instance=instance,
-        number=number,
-        mediatype="document",
-        media="https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
-        caption="Sample PDF document",
-        file_name="sample.pdf",
+    image, document = await asyncio.gather(
+        # Send image
+        client.messages.asend_media(
+            instance=instance,
+            number=number,
+            mediatype="image",
+            media="https://picsum.photos/400/300",
+            caption="This is a random image from Picsum! 📸",
+        ),
+        # Send document
+        client.messages.asend_media(
+            instance=instance,
+            number=number,
+            mediatype="document",
+            media="https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
+            caption="Sample PDF document",
+            file_name="sample.pdf",
+        ),
     )
-    print(f"  ✅ Document sent: {response.message_id}")
+    print(f"  ✅ Image sent: {image.message_id}")
+    print(f"  ✅ Document sent: {document.message_id}")
 
 
-def audio_messages_example(client: EvolutionClient, instance: str, number: str):
+async def audio_messages_example(client: EvolutionClient, instance: str, number: str):
     """Examples of sending audio messages."""
     print("🎵 Audio Messages:")
 
     # Send audio message
-    response = client.messages.send_audio(
+    response = await client.messages.asend_audio(
         instance=instance,
         number=number,
         audio="https://www.soundjay.com/misc/sounds/bell-ringing-05.wav",
@@ -83,12 +85,12 @@ def audio_messages_example(client: EvolutionClient, instance: str, number: str):
     print(f"  ✅ Audio sent: {response.message_id}")
 
 
-def location_messages_example(client: EvolutionClient, instance: str, number: str):
+async def location_messages_example(client: EvolutionClient, instance: str, number: str):
     """Examples of sending location messages."""
     print("📍 Location Messages:")
 
     # Send location
-    response = client.messages.send_location(
+    response = await client.messages.asend_location(
         instance=instance,
         number=number,
         name="Times Square",
@@ -99,7 +101,7 @@ def location_messages_example(client: EvolutionClient, instance: str, number: st
     print(f"  ✅ Location sent: {response.message_id}")
 
 
-def contact_messages_example(client: EvolutionClient, instance: str, number: str):
+async def contact_messages_example(client: EvolutionClient, instance: str, number: str):
     """Examples of sending contact messages."""
     print("👤 Contact Messages:")
 
@@ -114,16 +116,18 @@ def contact_messages_example(client: EvolutionClient, instance: str, number: str
         }
     ]
 
-    response = client.messages.send_contact(instance=instance, number=number, contacts=contacts)
+    response = await client.messages.asend_contact(
+        instance=instance, number=number, contacts=contacts
+    )
     print(f"  ✅ Contact sent: {response.message_id}")
 
 
-def interactive_messages_example(client: EvolutionClient, instance: str, number: str):
+async def interactive_messages_example(client: EvolutionClient, instance: str, number: str):
     """Examples of sending interactive messages."""
     print("🔘 Interactive Messages:")
 
     # Send poll
-    response = client.messages.send_poll(
+    response = await client.messages.asend_poll(
         instance=instance,
         number=number,
         name="What's your favorite programming language?",
@@ -133,12 +137,12 @@ def interactive_messages_example(client: EvolutionClient, instance: str, number:
     print(f"  ✅ Poll sent: {response.message_id}")
 
 
-def sticker_example(client: EvolutionClient, instance: str, number: str):
+async def sticker_example(client: EvolutionClient, instance: str, number: str):
     """Examples of sending stickers."""
     print("😄 Stickers:")
 
     # Send sticker
-    response = client.messages.send_sticker(
+    response = await client.messages.asend_sticker(
         instance=instance,
         number=number,
         sticker="https://github.com/WhatsApp/stickers/raw/main/Android/app/src/main/assets/1/01_Cuppy_smile.webp",
@@ -146,12 +150,12 @@ def sticker_example(client: EvolutionClient, instance: str, number: str):
     print(f"  ✅ Sticker sent: {response.message_id}")
 
 
-def status_example(client: EvolutionClient, instance: str):
+async def status_example(client: EvolutionClient, instance: str):
     """Examples of sending status/stories."""
     print("📱 Status/Stories:")
 
     # Send text status
-    response = client.messages.send_status(
+    response = await client.messages.asend_status(
         instance=instance,
         type="text",
         content="Hello from PyEvolution! 🚀",
@@ -162,7 +166,7 @@ def status_example(client: EvolutionClient, instance: str):
     print(f"  ✅ Text status sent: {response.message_id}")
 
 
-def main():
+async def main():
     """Main example function."""
     # Configuration
     INSTANCE_NAME = "message-demo"
@@ -176,34 +180,44 @@ def main():
         print("=" * 40)
 
         # Check if instance exists, create if needed
-        instances = client.instance.fetch_instances()
-        instance_exists = any(inst.instance_name == INSTANCE_NAME for inst in instances)
+        instances = await client.instance.afetch_instances()
+        names = {inst.instance_name for inst in instances}
+        instance_exists = INSTANCE_NAME in names
 
         if not instance_exists:
             print(f"Creating instance '{INSTANCE_NAME}'...")
-            client.instance.create(instance_name=INSTANCE_NAME, qrcode=True)
+            await client.instance.acreate(instance_name=INSTANCE_NAME, qrcode=True)
             print("⚠️  Please scan the QR code and connect WhatsApp first!")
             input("Press Enter after connecting...")
 
         # Check connection
-        status = client.instance.connection_state(INSTANCE_NAME)
+        status = await client.instance.aconnection_state(INSTANCE_NAME)
         print(f"Connection status: {status}")
 
-        # Run examples
-        text_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER)
-        media_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER)
-        audio_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER)
-        location_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER)
-        contact_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER)
-        interactive_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER)
-        sticker_example(client, INSTANCE_NAME, RECIPIENT_NUMBER)
-        status_example(client, INSTANCE_NAME)
-
-        print("\n✅ All examples completed successfully!")
+        # Run examples concurrently - they don't depend on each other
+        results = await asyncio.gather(
+            text_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER),
+            media_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER),
+            audio_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER),
+            location_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER),
+            contact_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER),
+            interactive_messages_example(client, INSTANCE_NAME, RECIPIENT_NUMBER),
+            sticker_example(client, INSTANCE_NAME, RECIPIENT_NUMBER),
+            status_example(client, INSTANCE_NAME),
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        for error in errors:
+            print(f"❌ Error: {error}")
+
+        if not errors:
+            print("\n✅ All examples completed successfully!")
 
     except Exception as e:
         print(f"❌ Error: {e}")
     finally:
+        await client.aclose()
         client.close()
 
 
@@ -214,4 +228,4 @@ if __name__ == "__main__":
 
         load_dotenv()
 
-    main()
+    asyncio.run(main())
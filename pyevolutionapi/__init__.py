@@ -31,7 +31,7 @@ from .exceptions import (
     ValidationError,
 )
 
-__all__ = [
+__all__ = (
     "EvolutionClient",
     "EvolutionAPIError",
     "AuthenticationError",
@@ -40,7 +40,7 @@ __all__ = [
     "ConnectionError",
     "TimeoutError",
     "RateLimitError",
-]
+)
 
 
 def create_client(
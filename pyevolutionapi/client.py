@@ -2,13 +2,17 @@
 Main client for Evolution API.
 """
 
+import asyncio
 import os
+import time
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from urllib.parse import urljoin
 
 import httpx
 from dotenv import load_dotenv
 
+from . import _json
 from .auth import ApiKeyAuth, AuthHandler
 from .exceptions import (
     AuthenticationError,
@@ -32,6 +36,24 @@ from .resources import (
 load_dotenv()
 
 
+@lru_cache(maxsize=256)
+def _build_url(base_url: str, endpoint: str, instance: Optional[str]) -> str:
+    """
+    Build the full URL for an endpoint, reused across requests.
+
+    Args:
+        base_url: Base URL of the Evolution API
+        endpoint: API endpoint, optionally containing an ``{instance}`` placeholder
+        instance: Instance name to substitute into the placeholder
+
+    Returns:
+        Full request URL
+    """
+    if instance and "{instance}" in endpoint:
+        endpoint = endpoint.replace("{instance}", instance)
+    return urljoin(base_url, endpoint.lstrip("/"))
+
+
 class EvolutionClient:
     """
     Main client for interacting with Evolution API.
@@ -44,6 +66,10 @@ class EvolutionClient:
 
     DEFAULT_TIMEOUT = 30.0
     DEFAULT_MAX_RETRIES = 3
+    DEFAULT_MAX_CONNECTIONS = 64
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 32
+    DEFAULT_KEEPALIVE_EXPIRY = 30.0
+    MAX_RETRY_AFTER = 60.0
 
     def __init__(
         self,
@@ -54,6 +80,10 @@ class EvolutionClient:
         max_retries: Optional[int] = None,
         verify_ssl: bool = True,
         debug: bool = False,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        transport: Optional[httpx.BaseTransport] = None,
         **kwargs: Any,
     ):
         """
@@ -67,6 +97,11 @@ class EvolutionClient:
             max_retries: Maximum number of retry attempts
             verify_ssl: Whether to verify SSL certificates
             debug: Enable debug mode
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            transport: Custom transport for the sync client (e.g. ``httpx.MockTransport``
+                in tests); replaces the default pooled transport with retries
             **kwargs: Additional configuration options
         """
         # Get configuration from environment if not provided
@@ -84,29 +119,38 @@ class EvolutionClient:
             os.getenv("EVOLUTION_MAX_RETRIES", str(self.DEFAULT_MAX_RETRIES))
         )
         self.verify_ssl = verify_ssl
+        self.limits = httpx.Limits(
+            max_connections=max_connections or self.DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                max_keepalive_connections or self.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=keepalive_expiry or self.DEFAULT_KEEPALIVE_EXPIRY,
+        )
         self.debug = debug or os.getenv("EVOLUTION_DEBUG", "").lower() in ["true", "1", "yes"]
 
         # Initialize auth handler
         self.auth = AuthHandler(api_key=self.api_key)
 
         # Configure HTTP client
-        self._configure_client()
+        self._configure_client(transport)
 
         # Initialize resources
         self._init_resources()
 
-    def _configure_client(self) -> None:
+    def _configure_client(self, transport: Optional[httpx.BaseTransport] = None) -> None:
         """Configure the HTTP client."""
         # Set up auth
         auth = None
         if self.api_key:
             auth = ApiKeyAuth(self.api_key)
 
-        # Configure transport with retries
-        transport = httpx.HTTPTransport(
-            retries=self.max_retries,
-            verify=self.verify_ssl,
-        )
+        # Configure transport with retries and a keep-alive connection pool
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                retries=self.max_retries,
+                verify=self.verify_ssl,
+                limits=self.limits,
+            )
 
         # Create client
         self._client = httpx.Client(
@@ -125,7 +169,7 @@ class EvolutionClient:
         self._async_client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
-            transport=httpx.AsyncHTTPTransport(retries=self.max_retries),
+            transport=httpx.AsyncHTTPTransport(retries=self.max_retries, limits=self.limits),
             auth=auth,
             headers={
                 "User-Agent": "PyEvolution/0.1.0",
@@ -193,12 +237,8 @@ class EvolutionClient:
         if instance is None:
             instance = self.default_instance
 
-        # Replace instance placeholder in endpoint if present
-        if instance and "{instance}" in endpoint:
-            endpoint = endpoint.replace("{instance}", instance)
-
-        # Build full URL
-        url = urljoin(self.base_url, endpoint.lstrip("/"))
+        # Build full URL (replacing the instance placeholder if present)
+        url = _build_url(self.base_url, endpoint, instance)
 
         # Prepare request
         request_kwargs = {
@@ -209,7 +249,10 @@ class EvolutionClient:
         }
 
         if json is not None:
-            request_kwargs["json"] = json
+            if _json.HAS_ORJSON:
+                request_kwargs["content"] = _json.dumps(json)
+            else:
+                request_kwargs["json"] = json
         elif data is not None:
             request_kwargs["data"] = data
         elif files is not None:
@@ -227,6 +270,12 @@ class EvolutionClient:
 
             response = self._client.request(**request_kwargs)
 
+            # Honor Retry-After once when rate limited
+            retry_after = self._get_retry_after(response)
+            if retry_after is not None and files is None:
+                time.sleep(retry_after)
+                response = self._client.request(**request_kwargs)
+
             if self.debug:
                 print(f"[DEBUG] Response: {response.status_code}")
 
@@ -253,19 +302,23 @@ class EvolutionClient:
         if instance is None:
             instance = self.default_instance
 
-        # Replace instance placeholder in endpoint if present
-        if instance and "{instance}" in endpoint:
-            endpoint = endpoint.replace("{instance}", instance)
-
-        # Build full URL
-        url = urljoin(self.base_url, endpoint.lstrip("/"))
+        # Build full URL (replacing the instance placeholder if present)
+        url = _build_url(self.base_url, endpoint, instance)
 
         # Prepare request
+        if kwargs.get("json") is not None and _json.HAS_ORJSON:
+            kwargs["content"] = _json.dumps(kwargs.pop("json"))
         request_kwargs = {"method": method, "url": url, **kwargs}
 
         # Make request
         try:
             response = await self._async_client.request(**request_kwargs)
+
+            # Honor Retry-After once when rate limited
+            retry_after = self._get_retry_after(response)
+            if retry_after is not None and "files" not in kwargs:
+                await asyncio.sleep(retry_after)
+                response = await self._async_client.request(**request_kwargs)
         except httpx.TimeoutException as e:
             raise EvolutionTimeoutError(f"Request timed out: {e}") from e
         except httpx.ConnectError as e:
@@ -277,6 +330,28 @@ class EvolutionClient:
         self._handle_response(response)
         return response
 
+    def _get_retry_after(self, response: httpx.Response) -> Optional[float]:
+        """
+        Get how long to wait before retrying a rate limited response.
+
+        Args:
+            response: The httpx Response object
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if response.status_code != 429:
+            return None
+
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            return None
+
+        if retry_after < 0 or retry_after > self.MAX_RETRY_AFTER:
+            return None
+        return retry_after
+
     def _handle_response(self, response: httpx.Response) -> None:
         """
         Handle API response and raise appropriate exceptions for errors.
@@ -292,7 +367,10 @@ class EvolutionClient:
 
         # Try to get error message from response
         try:
-            error_data = response.json()
+            if _json.HAS_ORJSON:
+                error_data = _json.loads(response.content)
+            else:
+                error_data = response.json()
             message = error_data.get("message", error_data.get("error", str(response.text)))
         except Exception:
             message = response.text or f"HTTP {response.status_code}"
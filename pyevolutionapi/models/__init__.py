@@ -19,7 +19,7 @@ from .message import (
 )
 from .webhook import WebhookConfig, WebhookEvent, WebhookResponse
 
-__all__ = [
+__all__ = (
     # Base
     "BaseModel",
     "BaseResponse",
@@ -53,4 +53,4 @@ __all__ = [
     "WebhookConfig",
     "WebhookEvent",
     "WebhookResponse",
-]
+)
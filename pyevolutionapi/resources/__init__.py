@@ -9,11 +9,11 @@ from .message import MessageResource
 from .profile import ProfileResource
 from .webhook import WebhookResource
 
-__all__ = [
+__all__ = (
     "InstanceResource",
     "MessageResource",
     "ChatResource",
     "GroupResource",
     "ProfileResource",
     "WebhookResource",
-]
+)
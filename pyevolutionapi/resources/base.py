@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
+from .. import _json
+
 if TYPE_CHECKING:
     from ..client import EvolutionClient
 
@@ -35,6 +37,8 @@ class BaseResource:
             Response data (dict, list, or other type)
         """
         if hasattr(response, "json"):
+            if _json.HAS_ORJSON:
+                return _json.loads(response.content)
             return response.json()
         elif isinstance(response, (dict, list)):
             return response
@@ -96,17 +100,22 @@ class BaseResource:
 
         return self._handle_response(response)
 
-    def _parse_response(self, response_data: Dict[str, Any], model: Type[T]) -> T:
+    def _parse_response(
+        self, response_data: Dict[str, Any], model: Type[T], trusted: bool = False
+    ) -> T:
         """
         Parse response data into a Pydantic model.
 
         Args:
             response_data: The response data dictionary
             model: The Pydantic model class to parse into
+            trusted: Build the model without validation or type coercion
 
         Returns:
             Instance of the model
         """
+        if trusted:
+            return model.model_construct(**response_data)
         return model.model_validate(response_data)
 
     async def _aget(
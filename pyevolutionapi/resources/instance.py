@@ -2,15 +2,83 @@
 Instance resource for managing WhatsApp instances.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from ..models.instance import Instance, InstanceCreate, InstanceResponse
 from .base import BaseResource
 
+if TYPE_CHECKING:
+    from ..client import EvolutionClient
+
+_CacheKey = Tuple[Optional[str], Optional[str], bool]
+
+# Built once at import; validates fetchInstances lists in a single call
+_INSTANCES_ADAPTER = TypeAdapter(List[Instance])
+
 
 class InstanceResource(BaseResource):
     """Resource for managing instances."""
 
+    def __init__(self, client: "EvolutionClient"):
+        """
+        Initialize resource with client.
+
+        Args:
+            client: The Evolution API client instance
+        """
+        super().__init__(client)
+
+        # Seconds to reuse fetch_instances results (0 disables caching)
+        self.cache_ttl = 0.0
+        self._instances_cache: Dict[_CacheKey, Tuple[float, List[Instance]]] = {}
+
+    def clear_cache(self) -> None:
+        """Discard cached fetch_instances results."""
+        self._instances_cache.clear()
+
+    def _get_cached_instances(self, key: _CacheKey) -> Optional[List[Instance]]:
+        """Return cached instances for a query if still fresh."""
+        if self.cache_ttl <= 0:
+            return None
+
+        cached = self._instances_cache.get(key)
+        if cached is None or time.monotonic() - cached[0] > self.cache_ttl:
+            return None
+        return list(cached[1])
+
+    def _store_instances(self, key: _CacheKey, instances: List[Instance]) -> List[Instance]:
+        """Store instances for a query when caching is enabled."""
+        if self.cache_ttl > 0:
+            self._instances_cache[key] = (time.monotonic(), list(instances))
+        return instances
+
+    @staticmethod
+    def _instance_items(response_data: Any) -> List[Any]:
+        """Extract the raw instance list from a fetchInstances response."""
+        if isinstance(response_data, list):
+            return response_data
+        if isinstance(response_data, dict) and "instances" in response_data:
+            return response_data["instances"]
+        return []
+
+    def _parse_instances(self, response_data: Any, trusted: bool = False) -> List[Instance]:
+        """Parse a fetchInstances response into a list of instances."""
+        if trusted:
+            return list(self._iter_parsed_instances(response_data, trusted))
+        # Validate the whole list in one call to the compiled validator
+        return _INSTANCES_ADAPTER.validate_python(self._instance_items(response_data))
+
+    def _iter_parsed_instances(
+        self, response_data: Any, trusted: bool = False
+    ) -> Iterator[Instance]:
+        """Lazily parse a fetchInstances response, one instance at a time."""
+        for item in self._instance_items(response_data):
+            yield self._parse_response(item, Instance, trusted=trusted)
+
     def create(self, instance_name: str, qrcode: bool = True, **kwargs: Any) -> InstanceResponse:
         """
         Create a new instance.
@@ -26,21 +94,37 @@ class InstanceResource(BaseResource):
         data = InstanceCreate(instance_name=instance_name, qrcode=qrcode, **kwargs).dict_for_api()
 
         response_data = self._post("/instance/create", json=data)
+        self.clear_cache()
         return self._parse_response(response_data, InstanceResponse)
 
     def fetch_instances(
-        self, instance_name: Optional[str] = None, instance_id: Optional[str] = None
+        self,
+        instance_name: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        force: bool = False,
+        trusted: bool = False,
     ) -> List[Instance]:
         """
         Fetch all instances or a specific instance.
 
+        Results are reused for ``cache_ttl`` seconds when caching is enabled.
+
         Args:
             instance_name: Optional instance name to filter
             instance_id: Optional instance ID to filter
+            force: Bypass the cache and always query the API
+            trusted: Skip model validation; values are kept exactly as the API
+                returned them (e.g. ``created_at`` stays a string)
 
         Returns:
             List of instances
         """
+        key = (instance_name, instance_id, trusted)
+        if not force:
+            cached = self._get_cached_instances(key)
+            if cached is not None:
+                return cached
+
         params = {}
         if instance_name:
             params["instanceName"] = instance_name
@@ -48,14 +132,36 @@ class InstanceResource(BaseResource):
             params["instanceId"] = instance_id
 
         response_data = self._get("/instance/fetchInstances", params=params)
+        return self._store_instances(key, self._parse_instances(response_data, trusted))
+
+    def iter_instances(
+        self,
+        instance_name: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        trusted: bool = False,
+    ) -> Iterator[Instance]:
+        """
+        Iterate over instances, parsing each one only when it is consumed.
 
-        # Handle response format
-        if isinstance(response_data, list):
-            return [self._parse_response(item, Instance) for item in response_data]
-        elif isinstance(response_data, dict) and "instances" in response_data:
-            return [self._parse_response(item, Instance) for item in response_data["instances"]]
-        else:
-            return []
+        The API returns every instance in a single response, but models are
+        built lazily so callers can process them without holding a full list.
+
+        Args:
+            instance_name: Optional instance name to filter
+            instance_id: Optional instance ID to filter
+            trusted: Skip model validation (see fetch_instances)
+
+        Returns:
+            Iterator of instances
+        """
+        params = {}
+        if instance_name:
+            params["instanceName"] = instance_name
+        if instance_id:
+            params["instanceId"] = instance_id
+
+        response_data = self._get("/instance/fetchInstances", params=params)
+        return self._iter_parsed_instances(response_data, trusted)
 
     def connect(self, instance: str, number: Optional[str] = None) -> InstanceResponse:
         """
@@ -73,6 +179,7 @@ class InstanceResource(BaseResource):
             params["number"] = number
 
         response_data = self._get(f"/instance/connect/{instance}", params=params)
+        self.clear_cache()
         return self._parse_response(response_data, InstanceResponse)
 
     def restart(self, instance: str) -> InstanceResponse:
@@ -86,6 +193,7 @@ class InstanceResource(BaseResource):
             InstanceResponse with status
         """
         response_data = self._post(f"/instance/restart/{instance}")
+        self.clear_cache()
         return self._parse_response(response_data, InstanceResponse)
 
     def connection_state(self, instance: str) -> Dict[str, Any]:
@@ -123,7 +231,9 @@ class InstanceResource(BaseResource):
         Returns:
             Response data
         """
-        return self._delete(f"/instance/logout/{instance}")
+        response_data = self._delete(f"/instance/logout/{instance}")
+        self.clear_cache()
+        return response_data
 
     def delete(self, instance: str) -> Dict[str, Any]:
         """
@@ -135,7 +245,30 @@ class InstanceResource(BaseResource):
         Returns:
             Response data
         """
-        return self._delete(f"/instance/delete/{instance}")
+        response_data = self._delete(f"/instance/delete/{instance}")
+        self.clear_cache()
+        return response_data
+
+    def bulk_delete(self, instances: List[str]) -> Dict[str, Any]:
+        """
+        Delete several instances reusing the same pooled connection.
+
+        The Evolution API has no batch delete endpoint, so one request is
+        issued per instance and failures are collected instead of raised.
+
+        Args:
+            instances: Instance names or IDs
+
+        Returns:
+            Mapping of each instance to its response data or the raised exception
+        """
+        results: Dict[str, Any] = {}
+        for instance in instances:
+            try:
+                results[instance] = self.delete(instance)
+            except Exception as e:
+                results[instance] = e
+        return results
 
     # Async methods
     async def acreate(
@@ -145,12 +278,23 @@ class InstanceResource(BaseResource):
         data = InstanceCreate(instance_name=instance_name, qrcode=qrcode, **kwargs).dict_for_api()
 
         response_data = await self._apost("/instance/create", json=data)
+        self.clear_cache()
         return self._parse_response(response_data, InstanceResponse)
 
     async def afetch_instances(
-        self, instance_name: Optional[str] = None, instance_id: Optional[str] = None
+        self,
+        instance_name: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        force: bool = False,
+        trusted: bool = False,
     ) -> List[Instance]:
         """Async version of fetch_instances."""
+        key = (instance_name, instance_id, trusted)
+        if not force:
+            cached = self._get_cached_instances(key)
+            if cached is not None:
+                return cached
+
         params = {}
         if instance_name:
             params["instanceName"] = instance_name
@@ -158,10 +302,48 @@ class InstanceResource(BaseResource):
             params["instanceId"] = instance_id
 
         response_data = await self._aget("/instance/fetchInstances", params=params)
+        return self._store_instances(key, self._parse_instances(response_data, trusted))
 
-        if isinstance(response_data, list):
-            return [self._parse_response(item, Instance) for item in response_data]
-        elif isinstance(response_data, dict) and "instances" in response_data:
-            return [self._parse_response(item, Instance) for item in response_data["instances"]]
-        else:
-            return []
+    async def aconnection_state(self, instance: str) -> Dict[str, Any]:
+        """Async version of connection_state."""
+        return await self._aget(f"/instance/connectionState/{instance}")
+
+    async def adelete(self, instance: str) -> Dict[str, Any]:
+        """Async version of delete."""
+        response_data = await self._adelete(f"/instance/delete/{instance}")
+        self.clear_cache()
+        return response_data
+
+    async def abulk_delete(
+        self, instances: List[str], concurrency: int = 8, rate: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of bulk_delete, running up to ``concurrency`` deletes at once.
+
+        Args:
+            instances: Instance names or IDs
+            concurrency: Maximum number of deletes in flight
+            rate: Optional maximum number of deletes started per second
+
+        Returns:
+            Mapping of each instance to its response data or the raised exception
+        """
+        sem = asyncio.Semaphore(concurrency)
+        interval = 1.0 / rate if rate else 0.0
+        loop = asyncio.get_running_loop()
+        next_slot = loop.time()
+
+        async def _one(instance: str) -> Any:
+            nonlocal next_slot
+            async with sem:
+                if interval:
+                    # Reserve the next start slot so deletes are spread over time
+                    now = loop.time()
+                    wait = next_slot - now
+                    next_slot = max(now, next_slot) + interval
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                return await self.adelete(instance)
+
+        results = await asyncio.gather(*(_one(i) for i in instances), return_exceptions=True)
+        return dict(zip(instances, results))
@@ -257,3 +257,130 @@ class MessageResource(BaseResource):
             f"/message/sendText/{instance}", json=message.dict_for_api()
         )
         return self._parse_response(response_data, MessageResponse)
+
+    async def asend_media(
+        self,
+        instance: str,
+        number: str,
+        mediatype: str,
+        media: str,
+        caption: Optional[str] = None,
+        **kwargs: Any,
+    ) -> MessageResponse:
+        """Async version of send_media."""
+        message = MediaMessage(
+            number=number, mediatype=mediatype, media=media, caption=caption, **kwargs
+        )
+        response_data = await self._apost(
+            f"/message/sendMedia/{instance}", json=message.dict_for_api()
+        )
+        return self._parse_response(response_data, MessageResponse)
+
+    async def asend_audio(
+        self, instance: str, number: str, audio: str, **kwargs: Any
+    ) -> MessageResponse:
+        """Async version of send_audio."""
+        message = AudioMessage(number=number, audio=audio, **kwargs)
+        response_data = await self._apost(
+            f"/message/sendWhatsAppAudio/{instance}", json=message.dict_for_api()
+        )
+        return self._parse_response(response_data, MessageResponse)
+
+    async def asend_location(
+        self,
+        instance: str,
+        number: str,
+        name: str,
+        address: str,
+        latitude: float,
+        longitude: float,
+        **kwargs: Any,
+    ) -> MessageResponse:
+        """Async version of send_location."""
+        message = LocationMessage(
+            number=number,
+            name=name,
+            address=address,
+            latitude=latitude,
+            longitude=longitude,
+            **kwargs,
+        )
+        response_data = await self._apost(
+            f"/message/sendLocation/{instance}", json=message.dict_for_api()
+        )
+        return self._parse_response(response_data, MessageResponse)
+
+    async def asend_contact(
+        self, instance: str, number: str, contacts: List[Dict[str, Any]], **kwargs: Any
+    ) -> MessageResponse:
+        """Async version of send_contact."""
+        contact_cards = [ContactCard(**contact) for contact in contacts]
+        message = ContactMessage(number=number, contact=contact_cards, **kwargs)
+        response_data = await self._apost(
+            f"/message/sendContact/{instance}", json=message.dict_for_api()
+        )
+        return self._parse_response(response_data, MessageResponse)
+
+    async def asend_reaction(
+        self, instance: str, key: Dict[str, Any], reaction: str
+    ) -> MessageResponse:
+        """Async version of send_reaction."""
+        message = ReactionMessage(key=key, reaction=reaction)
+        response_data = await self._apost(
+            f"/message/sendReaction/{instance}", json=message.dict_for_api()
+        )
+        return self._parse_response(response_data, MessageResponse)
+
+    async def asend_sticker(
+        self, instance: str, number: str, sticker: str, **kwargs: Any
+    ) -> MessageResponse:
+        """Async version of send_sticker."""
+        message = StickerMessage(number=number, sticker=sticker, **kwargs)
+        response_data = await self._apost(
+            f"/message/sendSticker/{instance}", json=message.dict_for_api()
+        )
+        return self._parse_response(response_data, MessageResponse)
+
+    async def asend_poll(
+        self,
+        instance: str,
+        number: str,
+        name: str,
+        values: List[str],
+        selectable_count: int = 1,
+        **kwargs: Any,
+    ) -> MessageResponse:
+        """Async version of send_poll."""
+        response_data = await self._apost(
+            f"/message/sendPoll/{instance}",
+            json={
+                "number": number,
+                "name": name,
+                "values": values,
+                "selectableCount": selectable_count,
+                **kwargs,
+            },
+        )
+        return self._parse_response(response_data, MessageResponse)
+
+    async def asend_status(
+        self,
+        instance: str,
+        type: str,
+        content: str,
+        all_contacts: bool = False,
+        status_jid_list: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> MessageResponse:
+        """Async version of send_status."""
+        response_data = await self._apost(
+            f"/message/sendStatus/{instance}",
+            json={
+                "type": type,
+                "content": content,
+                "allContacts": all_contacts,
+                "statusJidList": status_jid_list,
+                **kwargs,
+            },
+        )
+        return self._parse_response(response_data, MessageResponse)
@@ -18,20 +18,52 @@ OPÇÕES:
 """
 
 import argparse
+import importlib.util
 import os
-import subprocess
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Optional
 
-import requests
-from dotenv import load_dotenv
+import httpx
+from dotenv import dotenv_values
+
+# Arquivo com as credenciais reais da Evolution API
+_ENV_FILE = Path(".env.integration")
+
+# Cliente HTTP reutilizado entre tentativas (mantém a conexão viva)
+_HEALTH_CLIENT = httpx.Client(timeout=10.0)
+
+# Tentativas do health check e espera entre elas (API pode estar subindo)
+_HEALTH_ATTEMPTS = 3
+_HEALTH_BACKOFF = 0.5
+
+# Filtro de markers do pytest para cada modo de execução
+_MARKERS = {
+    # Executa testes rápidos apenas
+    "quick": ("-m", "integration and not slow"),
+    # Executa todos os testes
+    "all": ("-m", "integration"),
+    # Executa testes normais (sem QR, com alguns slow)
+    "normal": ("-m", "integration and not requires_qr"),
+}
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Dict[str, Optional[str]]:
+    """
+    Lê o .env.integration uma única vez.
+
+    Variáveis já definidas no ambiente têm precedência sobre o arquivo,
+    como no load_dotenv.
+    """
+    return {**dotenv_values(_ENV_FILE), **os.environ}
 
 
 def load_integration_env():
     """Carrega variáveis de ambiente para testes de integração."""
-    integration_env = Path(".env.integration")
-
-    if not integration_env.exists():
+    if not _ENV_FILE.exists():
         print("❌ Arquivo .env.integration não encontrado!")
         print("\n📋 Configure os testes de integração:")
         print("1. Copie .env.integration.example para .env.integration")
@@ -39,40 +71,50 @@ def load_integration_env():
         print("3. Execute novamente este script")
         return False
 
-    load_dotenv(integration_env)
+    # Exporta para os testes, que leem a configuração de os.environ
+    for key, value in get_config().items():
+        if value is not None:
+            os.environ.setdefault(key, value)
     return True
 
 
 def check_evolution_api():
     """Verifica se a Evolution API está acessível."""
-    base_url = os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080")
-    api_key = os.getenv("EVOLUTION_API_KEY")
+    config = get_config()
+    base_url = config.get("EVOLUTION_BASE_URL") or "http://localhost:8080"
+    api_key = config.get("EVOLUTION_API_KEY")
 
     if not api_key:
         print("❌ EVOLUTION_API_KEY não configurado no .env.integration")
         return False
 
-    try:
-        # Tenta fazer um health check básico
-        health_url = f"{base_url.rstrip('/')}/health"
-        response = requests.get(health_url, timeout=10)
-
-        if response.status_code == 200:
-            print(f"✅ Evolution API acessível: {base_url}")
-            return True
-        else:
-            print(f"⚠️ Evolution API respondeu com status {response.status_code}")
-            print("Continuando mesmo assim...")
-            return True
-
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Não foi possível conectar na Evolution API: {e}")
-        print(f"URL testada: {base_url}")
-        print("\n🔧 Verifique:")
-        print("- Evolution API está rodando?")
-        print("- URL está correta no .env.integration?")
-        print("- Firewall/proxy não está bloqueando?")
-        return False
+    # Tenta fazer um health check básico
+    health_url = f"{base_url.rstrip('/')}/health"
+
+    for attempt in range(1, _HEALTH_ATTEMPTS + 1):
+        try:
+            response = _HEALTH_CLIENT.get(health_url)
+            break
+        except httpx.HTTPError as e:
+            if attempt < _HEALTH_ATTEMPTS:
+                time.sleep(_HEALTH_BACKOFF * attempt)
+                continue
+
+            print(f"❌ Não foi possível conectar na Evolution API: {e}")
+            print(f"URL testada: {base_url}")
+            print("\n🔧 Verifique:")
+            print("- Evolution API está rodando?")
+            print("- URL está correta no .env.integration?")
+            print("- Firewall/proxy não está bloqueando?")
+            return False
+
+    if response.status_code == 200:
+        print(f"✅ Evolution API acessível: {base_url}")
+        return True
+
+    print(f"⚠️ Evolution API respondeu com status {response.status_code}")
+    print("Continuando mesmo assim...")
+    return True
 
 
 def show_setup_instructions():
@@ -102,6 +144,12 @@ def show_setup_instructions():
    --all       : Todos os testes (inclui testes que requerem QR)
    (padrão)    : Testes de integração normais
 
+⚡ EXECUÇÃO PARALELA (opcional):
+   pip install pytest-xdist
+   Com o pytest-xdist instalado, --quick e o modo padrão rodam em paralelo
+   (-n auto --dist=loadgroup)
+   pytest tests/integration/ -n 4 -m integration --dist=loadgroup
+
 🔍 COMANDOS PYTEST DIRETOS:
    pytest tests/integration/ -v -m integration
    pytest tests/integration/ -v -m "integration and not slow"
@@ -118,30 +166,42 @@ def show_setup_instructions():
 
 def run_tests(test_type="normal"):
     """Executa os testes de integração."""
-    base_cmd = ["python", "-m", "pytest", "tests/integration/", "-v"]
+    # Executado no mesmo processo via pytest.main (sem subir outro interpretador)
+    import pytest
+
+    if test_type not in _MARKERS:
+        test_type = "normal"
+
+    base_cmd = ["tests/integration/", "-v", *_MARKERS[test_type]]
 
     if test_type == "quick":
-        # Executa testes rápidos apenas
-        base_cmd.extend(["-m", "integration and not slow"])
         print("🏃 Executando testes rápidos de integração...")
 
     elif test_type == "all":
-        # Executa todos os testes
-        base_cmd.extend(["-m", "integration"])
         print("🔄 Executando TODOS os testes de integração (incluindo QR)...")
         print("⚠️  Alguns testes podem requerer escaneamento manual de QR code!")
 
     else:
-        # Executa testes normais (sem QR, com alguns slow)
-        base_cmd.extend(["-m", "integration and not requires_qr"])
         print("🧪 Executando testes de integração padrão...")
 
-    print(f"Comando: {' '.join(base_cmd)}")
+    # Paraleliza com pytest-xdist quando instalado. "loadgroup" distribui os testes
+    # entre os workers e mantém cada xdist_group (ex.: "readonly") num só worker;
+    # testes com QR ficam sequenciais porque o QR precisa aparecer no terminal
+    if test_type != "all" and importlib.util.find_spec("xdist") is not None:
+        base_cmd.extend(["-n", "auto", "--dist=loadgroup"])
+
+    print(f"Comando: pytest {' '.join(base_cmd)}")
     print("-" * 50)
 
     try:
-        result = subprocess.run(base_cmd, check=False)
-        return result.returncode == 0
+        exit_code = pytest.main(base_cmd)
+        if exit_code == pytest.ExitCode.INTERRUPTED:
+            print("\n⚡ Testes interrompidos pelo usuário")
+            return False
+        if exit_code == pytest.ExitCode.NO_TESTS_COLLECTED:
+            print("\n⚠️ Nenhum teste corresponde ao filtro de markers")
+            return False
+        return exit_code == pytest.ExitCode.OK
     except KeyboardInterrupt:
         print("\n⚡ Testes interrompidos pelo usuário")
         return False
@@ -20,45 +20,140 @@ import base64
 import os
 import sys
 import time
-from io import BytesIO
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from importlib.util import find_spec
+from io import BytesIO, StringIO
+from typing import Any, Dict, Optional, Union
 
 # Import dotenv
 try:
-    from dotenv import load_dotenv
+    from dotenv import dotenv_values
 
     DOTENV_AVAILABLE = True
 except ImportError:
     DOTENV_AVAILABLE = False
 
-    def load_dotenv(file_path):
-        pass  # Fallback function
+    def dotenv_values(file_path):
+        return {}  # Fallback function
 
 
-# Imports condicionais para bibliotecas opcionais
-try:
-    import qrcode
-    from PIL import Image
+from pyevolutionapi import EvolutionClient
 
-    QR_AVAILABLE = True
-except ImportError:
-    QR_AVAILABLE = False
 
-from pyevolutionapi import EvolutionClient
+@lru_cache(maxsize=1)
+def get_config() -> Dict[str, Optional[str]]:
+    """Lê o .env.integration uma única vez (o ambiente tem precedência)."""
+    return {**dotenv_values(".env.integration"), **os.environ}
+
+
+# Códigos de cores para terminal
+RESET = "\033[0m"
+BOLD = "\033[1m"
+RED = "\033[31m"
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+BLUE = "\033[34m"
+MAGENTA = "\033[35m"
+CYAN = "\033[36m"
+WHITE = "\033[37m"
 
 
 class Colors:
-    """Códigos de cores para terminal."""
+    """Códigos de cores para terminal (aliases das constantes do módulo)."""
+
+    RESET = RESET
+    BOLD = BOLD
+    RED = RED
+    GREEN = GREEN
+    YELLOW = YELLOW
+    BLUE = BLUE
+    MAGENTA = MAGENTA
+    CYAN = CYAN
+    WHITE = WHITE
+
+
+# Prefixos ANSI (negrito + cor) pré-montados para print_colored
+_COLORS = (RED, GREEN, YELLOW, BLUE, MAGENTA, CYAN, WHITE)
+_PREFIX = {
+    (bold, color): (BOLD if bold else "") + color for bold in (False, True) for color in _COLORS
+}
+
+
+@lru_cache(maxsize=1)
+def _load_qr():
+    """
+    Importa qrcode e PIL sob demanda (uma única vez).
+
+    Returns:
+        Tupla (qrcode, Image), ou (None, None) se as bibliotecas não estiverem instaladas
+    """
+    try:
+        import qrcode
+        from PIL import Image
+    except ImportError:
+        return None, None
+    return qrcode, Image
+
+
+def _qr_available() -> bool:
+    """Verifica se qrcode e PIL estão instalados, sem importá-los."""
+    return find_spec("qrcode") is not None and find_spec("PIL") is not None
+
+
+# Instruções exibidas abaixo do QR code, montadas uma única vez
+_HOW_TO_CONNECT = "\n{}\n{}\n".format(
+    _PREFIX[True, WHITE] + "📱 Como conectar:" + RESET,
+    "".join(
+        _PREFIX[False, WHITE] + line + RESET + "\n"
+        for line in (
+            "1. Abra o WhatsApp no seu celular",
+            "2. Toque em ⋮ (três pontos) > Dispositivos conectados",
+            "3. Toque em 'Conectar um dispositivo'",
+            "4. Escaneie o QR code acima",
+        )
+    ),
+)
+
+
+class _TTYBuffer(StringIO):
+    """Buffer em memória aceito pelo qrcode como terminal (print_ascii com tty=True)."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+@lru_cache(maxsize=8)
+def _render_qr_ascii(content: str, tty: bool) -> str:
+    """
+    Gera o QR code em ASCII para o terminal.
+
+    O resultado fica em cache, então reexibir o mesmo conteúdo não refaz a
+    codificação do QR.
+
+    Args:
+        content: Conteúdo a codificar
+        tty: Se deve usar as cores fixas de terminal do qrcode
+
+    Returns:
+        QR code renderizado em texto
+    """
+    qrcode, _ = _load_qr()
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=1,
+        border=2,
+    )
+    qr.add_data(content)
+    qr.make(fit=True)
+
+    buf = _TTYBuffer()
+    qr.print_ascii(out=buf, tty=tty)
+    return buf.getvalue()
 
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-    WHITE = "\033[37m"
+
+# Estados reportados por connection_state que dispensam confirmação via fetch
+_KNOWN_STATES = frozenset({"open", "connecting", "close"})
 
 
 class WhatsAppConnectionTester:
@@ -68,56 +163,68 @@ class WhatsAppConnectionTester:
         self.client = client
         self.instance_name = instance_name or f"whatsapp-test-{int(time.time())}"
         self.instance_created = False
+        self._initial_qr: Optional[str] = None  # QR devolvido na criação
         self.connection_timeout = 300  # 5 minutos
-        self.check_interval = 3  # 3 segundos
+        self.check_interval = 5  # intervalo máximo entre verificações (segundos)
+        self._fetch_every = 5  # consulta fetch_instances a cada N verificações
 
-    def print_colored(self, text: str, color: str = Colors.WHITE, bold: bool = False):
+    def print_colored(self, text: str, color: str = WHITE, bold: bool = False):
         """Imprime texto colorido no terminal."""
-        prefix = Colors.BOLD if bold else ""
-        print(f"{prefix}{color}{text}{Colors.RESET}")
+        sys.stdout.write(_PREFIX[bold, color] + text + RESET + "\n")
 
     def print_header(self, text: str):
         """Imprime cabeçalho estilizado."""
         print()
-        self.print_colored("=" * 60, Colors.CYAN, bold=True)
-        self.print_colored(f" {text} ", Colors.WHITE, bold=True)
-        self.print_colored("=" * 60, Colors.CYAN, bold=True)
+        self.print_colored("=" * 60, CYAN, bold=True)
+        self.print_colored(f" {text} ", WHITE, bold=True)
+        self.print_colored("=" * 60, CYAN, bold=True)
         print()
 
-    def decode_base64_qr(self, base64_data: str) -> Optional[str]:
+    def decode_base64_qr(self, base64_data: Union[str, bytes]) -> Optional[str]:
         """
         Decodifica QR code em base64 para extrair o conteúdo.
 
         Args:
-            base64_data: String base64 do QR code
+            base64_data: Base64 do QR code (str ou bytes)
 
         Returns:
             Conteúdo do QR code ou None se falhar
         """
         try:
-            # Remove prefixo data:image se presente
-            if base64_data.startswith("data:image"):
-                base64_data = base64_data.split(",", 1)[1]
+            # Trabalha em bytes; o prefixo data:image é descartado com uma
+            # memoryview, sem copiar o payload
+            if isinstance(base64_data, str):
+                base64_data = base64_data.encode("ascii")
+            payload = memoryview(base64_data)
+            if base64_data.startswith(b"data:image"):
+                payload = payload[base64_data.index(b",") + 1 :]
 
             # Decodifica base64
-            image_data = base64.b64decode(base64_data)
+            image_data = base64.b64decode(payload)
 
             # Se tiver PIL disponível, pode tentar extrair dados do QR
-            if QR_AVAILABLE:
+            _, Image = _load_qr()
+            if Image is not None:
                 try:
                     from pyzbar import pyzbar
 
-                    image = Image.open(BytesIO(image_data))
-                    decoded = pyzbar.decode(image)
+                    # Converte para tons de cinza e entrega os bytes crus ao ZBar,
+                    # procurando apenas QR codes
+                    image = Image.open(BytesIO(image_data)).convert("L")
+                    decoded = pyzbar.decode(
+                        (image.tobytes(), image.width, image.height),
+                        symbols=[pyzbar.ZBarSymbol.QRCODE],
+                    )
                     if decoded:
                         return decoded[0].data.decode("utf-8")
                 except ImportError:
                     pass  # pyzbar não disponível
 
-            return base64_data  # Retorna o base64 mesmo se não conseguir decodificar
+            # Retorna o base64 mesmo se não conseguir decodificar
+            return bytes(payload).decode("ascii")
 
         except Exception as e:
-            self.print_colored(f"⚠️ Erro ao decodificar QR: {e}", Colors.YELLOW)
+            self.print_colored(f"⚠️ Erro ao decodificar QR: {e}", YELLOW)
             return None
 
     def display_qr_code(self, qr_data: str):
@@ -129,61 +236,41 @@ class WhatsAppConnectionTester:
         """
         self.print_header("QR CODE PARA CONEXÃO WHATSAPP")
 
-        if not QR_AVAILABLE:
-            self.print_colored("⚠️ Bibliotecas qrcode/PIL não instaladas", Colors.YELLOW)
-            self.print_colored("📦 Instale com: pip install qrcode[pil]", Colors.CYAN)
+        if _load_qr()[0] is None:
+            self.print_colored("⚠️ Bibliotecas qrcode/PIL não instaladas", YELLOW)
+            self.print_colored("📦 Instale com: pip install qrcode[pil]", CYAN)
             print()
-            self.print_colored("📱 QR Code (base64):", Colors.WHITE, bold=True)
+            self.print_colored("📱 QR Code (base64):", WHITE, bold=True)
             # Mostra base64 truncado
             qr_preview = qr_data[:100] + "..." if len(qr_data) > 100 else qr_data
             print(qr_preview)
             print()
-            self.print_colored("💡 Cole este base64 em um gerador online de QR code", Colors.CYAN)
+            self.print_colored("💡 Cole este base64 em um gerador online de QR code", CYAN)
             self.print_colored(
-                "   Exemplo: https://codebeautify.org/base64-to-image-converter", Colors.CYAN
+                "   Exemplo: https://codebeautify.org/base64-to-image-converter", CYAN
             )
             return
 
         try:
-            # Cria QR code ASCII para o terminal
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=1,
-                border=2,
-            )
-
             # Se é base64, usa diretamente, senão assume que é o conteúdo
             qr_content = qr_data
             if qr_data.startswith("data:image") or len(qr_data) > 200:
                 # Para base64 muito longo, cria um QR simples
                 qr_content = f"WhatsApp connection: {self.instance_name}"
 
-            qr.add_data(qr_content)
-            qr.make(fit=True)
+            qr_ascii = _render_qr_ascii(qr_content, sys.stdout.isatty())
 
             # Exibe no terminal
-            self.print_colored(
-                "📱 Escaneie este QR code com seu WhatsApp:", Colors.GREEN, bold=True
-            )
+            self.print_colored("📱 Escaneie este QR code com seu WhatsApp:", GREEN, bold=True)
             print()
 
-            # QR code ASCII
-            qr.print_ascii(out=sys.stdout, tty=True)
-
-            print()
-            self.print_colored("📱 Como conectar:", Colors.WHITE, bold=True)
-            self.print_colored("1. Abra o WhatsApp no seu celular", Colors.WHITE)
-            self.print_colored(
-                "2. Toque em ⋮ (três pontos) > Dispositivos conectados", Colors.WHITE
-            )
-            self.print_colored("3. Toque em 'Conectar um dispositivo'", Colors.WHITE)
-            self.print_colored("4. Escaneie o QR code acima", Colors.WHITE)
-            print()
+            # QR code ASCII e instruções em uma única escrita
+            sys.stdout.write(qr_ascii + _HOW_TO_CONNECT)
+            sys.stdout.flush()
 
         except Exception as e:
-            self.print_colored(f"❌ Erro ao gerar QR ASCII: {e}", Colors.RED)
-            self.print_colored("📱 QR Code (dados):", Colors.WHITE, bold=True)
+            self.print_colored(f"❌ Erro ao gerar QR ASCII: {e}", RED)
+            self.print_colored("📱 QR Code (dados):", WHITE, bold=True)
             # Fallback: mostra dados truncados
             qr_preview = qr_data[:200] + "..." if len(qr_data) > 200 else qr_data
             print(qr_preview)
@@ -201,31 +288,32 @@ class WhatsAppConnectionTester:
             # Remove instância anterior se existir
             try:
                 self.client.instance.delete(self.instance_name)
-                self.print_colored("🗑️ Instância anterior removida", Colors.YELLOW)
+                self.print_colored("🗑️ Instância anterior removida", YELLOW)
                 time.sleep(2)
             except:
                 pass
 
             # Cria nova instância
-            self.print_colored(f"📱 Criando instância: {self.instance_name}", Colors.CYAN)
+            self.print_colored(f"📱 Criando instância: {self.instance_name}", CYAN)
 
             response = self.client.instance.create(instance_name=self.instance_name, qrcode=True)
 
             self.instance_created = True
-            self.print_colored("✅ Instância criada com sucesso!", Colors.GREEN, bold=True)
+            self._initial_qr = response.qr_code_base64
+            self.print_colored("✅ Instância criada com sucesso!", GREEN, bold=True)
 
             # Informações da resposta
             if response.instance:
-                self.print_colored(f"📋 Status: {response.instance.status}", Colors.WHITE)
-                self.print_colored(f"📋 ID: {response.instance.instance_id}", Colors.WHITE)
+                self.print_colored(f"📋 Status: {response.instance.status}", WHITE)
+                self.print_colored(f"📋 ID: {response.instance.instance_id}", WHITE)
 
             if response.hash:
-                self.print_colored(f"📋 Hash: {response.hash}", Colors.WHITE)
+                self.print_colored(f"📋 Hash: {response.hash}", WHITE)
 
             return {"response": response, "success": True}
 
         except Exception as e:
-            self.print_colored(f"❌ Erro ao criar instância: {e}", Colors.RED)
+            self.print_colored(f"❌ Erro ao criar instância: {e}", RED)
             return {"error": str(e), "success": False}
 
     def get_qr_code(self) -> Optional[str]:
@@ -237,24 +325,28 @@ class WhatsAppConnectionTester:
         """
         try:
             # Tenta via connect primeiro
-            self.print_colored("🔗 Obtendo QR code via connect...", Colors.CYAN)
+            self.print_colored("🔗 Obtendo QR code via connect...", CYAN)
 
             connect_response = self.client.instance.connect(self.instance_name)
 
             if connect_response and hasattr(connect_response, "qr_code_base64"):
                 qr_b64 = connect_response.qr_code_base64
                 if qr_b64:
-                    self.print_colored("✅ QR code obtido via connect", Colors.GREEN)
+                    self.print_colored("✅ QR code obtido via connect", GREEN)
                     return qr_b64
 
-            # Se connect não funcionou, verifica response original
-            self.print_colored("🔄 Tentando obter QR da resposta de criação...", Colors.YELLOW)
+            # Se connect não funcionou, usa o QR já recebido na criação
+            self.print_colored("🔄 Tentando obter QR da resposta de criação...", YELLOW)
+
+            if self._initial_qr:
+                self.print_colored("✅ QR code obtido da criação", GREEN)
+                return self._initial_qr
 
             # Re-cria para forçar QR novo (algumas APIs só mostram na criação)
             response = self.client.instance.create(instance_name=self.instance_name, qrcode=True)
 
             if response.qr_code_base64:
-                self.print_colored("✅ QR code obtido da criação", Colors.GREEN)
+                self.print_colored("✅ QR code obtido da criação", GREEN)
                 return response.qr_code_base64
 
             # Verifica qrcode dict
@@ -262,16 +354,25 @@ class WhatsAppConnectionTester:
                 qr_b64 = response.qrcode.get("base64")
                 if not qr_b64.startswith("data:image"):
                     qr_b64 = f"data:image/png;base64,{qr_b64}"
-                self.print_colored("✅ QR code obtido do campo qrcode", Colors.GREEN)
+                self.print_colored("✅ QR code obtido do campo qrcode", GREEN)
                 return qr_b64
 
-            self.print_colored("⚠️ QR code não disponível na resposta", Colors.YELLOW)
+            self.print_colored("⚠️ QR code não disponível na resposta", YELLOW)
             return None
 
         except Exception as e:
-            self.print_colored(f"❌ Erro ao obter QR code: {e}", Colors.RED)
+            self.print_colored(f"❌ Erro ao obter QR code: {e}", RED)
             return None
 
+    def _find_instance(self):
+        """Localiza a instância testada via fetch_instances (ou None)."""
+        for instance in self.client.instance.fetch_instances():
+            if (instance.id and self.instance_name in [instance.name, instance.id]) or (
+                instance.name and instance.name == self.instance_name
+            ):
+                return instance
+        return None
+
     def monitor_connection(self, timeout: int = None) -> bool:
         """
         Monitora conexão da instância até conectar ou timeout.
@@ -285,37 +386,39 @@ class WhatsAppConnectionTester:
         timeout = timeout or self.connection_timeout
 
         self.print_header("MONITORANDO CONEXÃO")
-        self.print_colored(f"⏱️ Aguardando conexão por até {timeout//60} minutos...", Colors.CYAN)
-        self.print_colored("⏹️ Pressione Ctrl+C para cancelar", Colors.YELLOW)
+        self.print_colored(f"⏱️ Aguardando conexão por até {timeout//60} minutos...", CYAN)
+        self.print_colored("⏹️ Pressione Ctrl+C para cancelar", YELLOW)
         print()
 
-        start_time = time.time()
+        # Relógio monotônico: imune a ajustes do relógio do sistema (NTP)
+        deadline = time.monotonic() + timeout
         attempt = 0
+        interval = 1.0  # cresce 1.5x a cada verificação até check_interval
 
         try:
-            while time.time() - start_time < timeout:
+            while (now := time.monotonic()) < deadline:
                 attempt += 1
-                elapsed = int(time.time() - start_time)
-                remaining = timeout - elapsed
+                remaining = int(deadline - now)
 
                 # Status visual
                 dots = "." * ((attempt % 3) + 1)
                 self.print_colored(
                     f"🔍 Verificando conexão{dots} "
                     f"(tentativa {attempt}, restam {remaining//60}:{remaining%60:02d})",
-                    Colors.BLUE,
+                    BLUE,
                 )
 
                 try:
                     # Verifica status via connection_state
                     status = self.client.instance.connection_state(self.instance_name)
+                    state = "unknown"
 
                     if isinstance(status, dict):
                         state = status.get("state", "unknown")
 
                         if state == "open":
                             self.print_colored(
-                                "🎉 WHATSAPP CONECTADO COM SUCESSO!", Colors.GREEN, bold=True
+                                "🎉 WHATSAPP CONECTADO COM SUCESSO!", GREEN, bold=True
                             )
 
                             # Informações adicionais
@@ -323,58 +426,52 @@ class WhatsAppConnectionTester:
                                 instance_info = status["instance"]
                                 if instance_info.get("profileName"):
                                     self.print_colored(
-                                        f"👤 Nome: {instance_info['profileName']}", Colors.WHITE
+                                        f"👤 Nome: {instance_info['profileName']}", WHITE
                                     )
                                 if instance_info.get("number"):
                                     self.print_colored(
-                                        f"📞 Número: {instance_info['number']}", Colors.WHITE
+                                        f"📞 Número: {instance_info['number']}", WHITE
                                     )
 
                             return True
 
                         elif state == "connecting":
-                            self.print_colored(
-                                f"🔄 Status: {state} (aguardando QR scan)", Colors.YELLOW
-                            )
+                            self.print_colored(f"🔄 Status: {state} (aguardando QR scan)", YELLOW)
                         else:
-                            self.print_colored(f"📊 Status: {state}", Colors.WHITE)
-
-                    # Também verifica via fetch_instances
-                    instances = self.client.instance.fetch_instances()
-                    for instance in instances:
-                        if (instance.id and self.instance_name in [instance.name, instance.id]) or (
-                            instance.name and instance.name == self.instance_name
-                        ):
+                            self.print_colored(f"📊 Status: {state}", WHITE)
 
+                    # Só confirma via fetch_instances quando o estado é ambíguo, e no
+                    # máximo a cada _fetch_every verificações (a lista é pesada)
+                    if state not in _KNOWN_STATES and (attempt - 1) % self._fetch_every == 0:
+                        instance = self._find_instance()
+                        if instance is not None:
                             if instance.is_connected:
                                 self.print_colored(
-                                    "🎉 CONEXÃO DETECTADA VIA FETCH!", Colors.GREEN, bold=True
+                                    "🎉 CONEXÃO DETECTADA VIA FETCH!", GREEN, bold=True
                                 )
                                 return True
 
                             if instance.state:
-                                self.print_colored(
-                                    f"📊 Instance state: {instance.state}", Colors.WHITE
-                                )
-                            break
+                                self.print_colored(f"📊 Instance state: {instance.state}", WHITE)
 
                 except Exception as e:
-                    self.print_colored(f"⚠️ Erro ao verificar status: {e}", Colors.YELLOW)
+                    self.print_colored(f"⚠️ Erro ao verificar status: {e}", YELLOW)
 
-                # Aguarda antes da próxima verificação
-                time.sleep(self.check_interval)
+                # Aguarda antes da próxima verificação (backoff exponencial)
+                time.sleep(interval)
+                interval = min(interval * 1.5, self.check_interval)
 
                 # Limpa linha para próximo status (opcional)
                 # print("\033[A\033[K", end="")  # Move cursor para linha anterior e limpa
 
             # Timeout
-            self.print_colored(f"⏰ Timeout de {timeout//60} minutos atingido", Colors.RED)
-            self.print_colored("❌ WhatsApp não foi conectado", Colors.RED)
+            self.print_colored(f"⏰ Timeout de {timeout//60} minutos atingido", RED)
+            self.print_colored("❌ WhatsApp não foi conectado", RED)
             return False
 
         except KeyboardInterrupt:
             print()
-            self.print_colored("⚡ Monitoramento interrompido pelo usuário", Colors.YELLOW)
+            self.print_colored("⚡ Monitoramento interrompido pelo usuário", YELLOW)
             return False
 
     def cleanup(self):
@@ -383,9 +480,9 @@ class WhatsAppConnectionTester:
             self.print_header("LIMPEZA")
             try:
                 self.client.instance.delete(self.instance_name)
-                self.print_colored(f"🗑️ Instância removida: {self.instance_name}", Colors.GREEN)
+                self.print_colored(f"🗑️ Instância removida: {self.instance_name}", GREEN)
             except Exception as e:
-                self.print_colored(f"⚠️ Erro na limpeza: {e}", Colors.YELLOW)
+                self.print_colored(f"⚠️ Erro na limpeza: {e}", YELLOW)
 
     def run_test(self, auto_cleanup: bool = True) -> bool:
         """
@@ -406,7 +503,7 @@ class WhatsAppConnectionTester:
             # 2. Obter QR code
             qr_code = self.get_qr_code()
             if not qr_code:
-                self.print_colored("❌ Não foi possível obter QR code", Colors.RED)
+                self.print_colored("❌ Não foi possível obter QR code", RED)
                 return False
 
             # 3. Exibir QR code
@@ -417,20 +514,16 @@ class WhatsAppConnectionTester:
 
             if connected:
                 self.print_header("TESTE CONCLUÍDO COM SUCESSO")
-                self.print_colored(
-                    "✅ WhatsApp conectado à Evolution API!", Colors.GREEN, bold=True
-                )
-                self.print_colored(
-                    "🎯 Todas as correções Pydantic validadas!", Colors.GREEN, bold=True
-                )
+                self.print_colored("✅ WhatsApp conectado à Evolution API!", GREEN, bold=True)
+                self.print_colored("🎯 Todas as correções Pydantic validadas!", GREEN, bold=True)
             else:
                 self.print_header("TESTE INTERROMPIDO")
-                self.print_colored("⚠️ Conexão não estabelecida", Colors.YELLOW)
+                self.print_colored("⚠️ Conexão não estabelecida", YELLOW)
 
             return connected
 
         except Exception as e:
-            self.print_colored(f"💥 Erro crítico no teste: {e}", Colors.RED)
+            self.print_colored(f"💥 Erro crítico no teste: {e}", RED)
             return False
 
         finally:
@@ -475,21 +568,17 @@ Dependências necessárias:
 
         deps_ok = True
 
-        # qrcode
-        try:
-            import qrcode
-
+        # qrcode (find_spec verifica a instalação sem importar o módulo)
+        if find_spec("qrcode") is not None:
             print("✅ qrcode: disponível")
-        except ImportError:
+        else:
             print("❌ qrcode: não encontrado")
             deps_ok = False
 
         # PIL
-        try:
-            from PIL import Image
-
+        if find_spec("PIL") is not None:
             print("✅ PIL (Pillow): disponível")
-        except ImportError:
+        else:
             print("❌ PIL (Pillow): não encontrado")
             deps_ok = False
 
@@ -510,7 +599,7 @@ Dependências necessárias:
         return 0 if deps_ok else 1
 
     # Verifica se dependências básicas estão disponíveis
-    if not QR_AVAILABLE:
+    if not _qr_available():
         print("⚠️ Bibliotecas de QR code não encontradas")
         print("📦 Instale com: pip install qrcode[pil]")
         print("💡 O teste funcionará, mas QR será exibido como base64")
@@ -522,9 +611,9 @@ Dependências necessárias:
             return 1
 
     # Carrega configuração
-    load_dotenv(".env.integration")
+    config = get_config()
 
-    api_key = os.getenv("EVOLUTION_API_KEY")
+    api_key = config.get("EVOLUTION_API_KEY")
     if not api_key:
         print("❌ EVOLUTION_API_KEY não configurado no .env.integration")
         print("💡 Configure suas credenciais da Evolution API")
@@ -532,7 +621,7 @@ Dependências necessárias:
 
     # Cria cliente
     client = EvolutionClient(
-        base_url=os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080"),
+        base_url=config.get("EVOLUTION_BASE_URL") or "http://localhost:8080",
         api_key=api_key,
         timeout=60.0,
         debug=False,  # Reduz logs para melhor experiência visual
@@ -544,31 +633,31 @@ Dependências necessárias:
 
     # Banner inicial
     tester.print_header("TESTE DE CONEXÃO WHATSAPP - PYEVOLUTION")
-    tester.print_colored("🚀 Iniciando teste interativo de conexão", Colors.CYAN, bold=True)
-    tester.print_colored(f"📱 Instância: {tester.instance_name}", Colors.WHITE)
-    tester.print_colored(f"⏱️ Timeout: {args.timeout//60} minutos", Colors.WHITE)
-    tester.print_colored(f"🧹 Auto-limpeza: {'Não' if args.no_cleanup else 'Sim'}", Colors.WHITE)
+    tester.print_colored("🚀 Iniciando teste interativo de conexão", CYAN, bold=True)
+    tester.print_colored(f"📱 Instância: {tester.instance_name}", WHITE)
+    tester.print_colored(f"⏱️ Timeout: {args.timeout//60} minutos", WHITE)
+    tester.print_colored(f"🧹 Auto-limpeza: {'Não' if args.no_cleanup else 'Sim'}", WHITE)
 
     # Executa teste
     try:
         success = tester.run_test(auto_cleanup=not args.no_cleanup)
 
         if success:
-            tester.print_colored("\n🎉 TESTE CONCLUÍDO COM SUCESSO!", Colors.GREEN, bold=True)
+            tester.print_colored("\n🎉 TESTE CONCLUÍDO COM SUCESSO!", GREEN, bold=True)
             return 0
         else:
-            tester.print_colored("\n⚠️ Teste não completado", Colors.YELLOW, bold=True)
+            tester.print_colored("\n⚠️ Teste não completado", YELLOW, bold=True)
             return 1
 
     except KeyboardInterrupt:
         print()
-        tester.print_colored("⚡ Teste interrompido pelo usuário", Colors.YELLOW)
+        tester.print_colored("⚡ Teste interrompido pelo usuário", YELLOW)
         if not args.no_cleanup:
             tester.cleanup()
         return 1
 
     except Exception as e:
-        tester.print_colored(f"\n💥 Erro fatal: {e}", Colors.RED)
+        tester.print_colored(f"\n💥 Erro fatal: {e}", RED)
         if not args.no_cleanup:
             tester.cleanup()
         return 1
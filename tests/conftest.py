@@ -2,44 +2,184 @@
 Pytest configuration and fixtures.
 """
 
-from unittest.mock import Mock
+import os
+from typing import Any, Dict, Union
 
 import httpx
 import pytest
 
 from pyevolutionapi import EvolutionClient
+from tests.utils.api_helpers import IntegrationHelper, TestInstanceManager
+from tests.utils.test_helpers import (
+    MockEvolutionClient,
+    close_real_api_clients,
+    debug_caching,
+    real_api_client,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_key():
     """Mock API key for testing."""
     return "test-api-key-12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_base_url():
     """Mock base URL for testing."""
     return "http://localhost:8080"
 
 
+# Environment applied to every test (env_setup) and to the session-scoped client
+_TEST_ENV = {"EVOLUTION_DEBUG": "false", "EVOLUTION_LOG_LEVEL": "WARNING"}
+
+
+@pytest.fixture(scope="session")
+def session_client(mock_base_url, mock_api_key):
+    """Create one test client (and connection pool) for the whole session."""
+    # Built before the function-scoped env_setup runs, so apply the test environment
+    # here and pin the settings it would otherwise read from the developer's shell
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in _TEST_ENV.items():
+            mp.setenv(name, value)
+        client = EvolutionClient(
+            base_url=mock_base_url,
+            api_key=mock_api_key,
+            default_instance="test-instance",
+            timeout=EvolutionClient.DEFAULT_TIMEOUT,
+            max_retries=EvolutionClient.DEFAULT_MAX_RETRIES,
+        )
+    yield client
+    client.close()
+
+
 @pytest.fixture
-def client(mock_base_url, mock_api_key):
-    """Create a test client."""
-    return EvolutionClient(
-        base_url=mock_base_url, api_key=mock_api_key, default_instance="test-instance"
-    )
+def client(session_client):
+    """Shared test client with per-test state cleared."""
+    session_client.instance.clear_cache()
+    return session_client
+
+
+@debug_caching
+def _real_api_is_healthy(base_url: str, api_key: str) -> bool:
+    """Probe the real Evolution API (cached on disk under DEBUG_CACHING)."""
+    return real_api_client(base_url, api_key).health_check()
+
+
+@pytest.fixture(scope="session")
+def api_config():
+    """Real Evolution API configuration shared by integration and E2E tests."""
+    api_key = os.getenv("EVOLUTION_API_KEY")
+
+    if not api_key:
+        pytest.skip("EVOLUTION_API_KEY not configured - skipping tests against the real API")
+
+    return {
+        "base_url": os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080"),
+        "api_key": api_key,
+        "timeout": 60.0,
+    }
+
+
+# Result of the real-API probe: the client, or the skip reason
+_REAL_CLIENT_KEY = pytest.StashKey[Union[EvolutionClient, str]]()
+
+
+def _needs_real_api(item: pytest.Item) -> bool:
+    return "real_client" in item.fixturenames or item.get_closest_marker("integration") is not None
+
+
+def _probe_real_api(config: pytest.Config) -> Union[EvolutionClient, str]:
+    """Probe the real Evolution API once per process and stash the outcome."""
+    if _REAL_CLIENT_KEY in config.stash:
+        return config.stash[_REAL_CLIENT_KEY]
+
+    api_key = os.getenv("EVOLUTION_API_KEY")
+    if not api_key:
+        result = "EVOLUTION_API_KEY not configured - skipping tests against the real API"
+    else:
+        base_url = os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080")
+        if _real_api_is_healthy(base_url, api_key):
+            result = real_api_client(base_url, api_key)
+        else:
+            result = "Evolution API not accessible"
+
+    config.stash[_REAL_CLIENT_KEY] = result
+    return result
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip real-API tests at collection time when the API is unavailable."""
+    real_api_items = [item for item in items if _needs_real_api(item)]
+    if not real_api_items:
+        return  # Unit-only runs never touch the network
+
+    client = _probe_real_api(config)
+    if not isinstance(client, str):
+        return
+
+    # Marked up front so their fixtures (instance cleanup, waits) never run
+    skip = pytest.mark.skip(reason=client)
+    for item in real_api_items:
+        item.add_marker(skip)
+
+
+def pytest_sessionfinish(session):
+    """Close the real API clients opened during the session."""
+    close_real_api_clients()
+
+
+@pytest.fixture(scope="session")
+def real_client(request):
+    """Real Evolution API client, shared by integration and E2E tests."""
+    client = _probe_real_api(request.config)
+    if isinstance(client, str):
+        pytest.skip(client)
+    return client
+
+
+@pytest.fixture
+def api_helper(real_client):
+    """IntegrationHelper on the shared real client; cleans up the instances it created."""
+    helper = IntegrationHelper(real_client)
+    yield helper
+    helper.cleanup_instances()
+
+
+@pytest.fixture
+def instance_manager(real_client):
+    """TestInstanceManager on the shared real client; deletes its instances afterwards."""
+    with TestInstanceManager(real_client) as manager:
+        yield manager
+
+
+@pytest.fixture(scope="session")
+def _session_mock_client():
+    """Mock Evolution client built once per session."""
+    return MockEvolutionClient()
+
+
+@pytest.fixture
+def mock_client(_session_mock_client):
+    """Mock Evolution client, reset to its default responses for each test."""
+    _session_mock_client.reset_mock()
+    return _session_mock_client
 
 
 @pytest.fixture
 def mock_response():
-    """Create a mock HTTP response."""
-    response = Mock(spec=httpx.Response)
-    response.status_code = 200
-    response.is_success = True
-    response.json.return_value = {"status": "success"}
-    response.text = '{"status": "success"}'
-    response.headers = {}
-    return response
+    """Create a successful HTTP response."""
+    return httpx.Response(200, json={"status": "success"})
+
+
+@pytest.fixture(scope="session")
+def make_error_response():
+    """Factory for error responses: make_error_response(status, body)."""
+
+    def _make(status_code: int, body: Dict[str, Any]) -> httpx.Response:
+        return httpx.Response(status_code, json=body)
+
+    return _make
 
 
 @pytest.fixture
@@ -74,5 +214,5 @@ def mock_message_response():
 @pytest.fixture(autouse=True)
 def env_setup(monkeypatch):
     """Set up environment variables for testing."""
-    monkeypatch.setenv("EVOLUTION_DEBUG", "false")
-    monkeypatch.setenv("EVOLUTION_LOG_LEVEL", "WARNING")
+    for name, value in _TEST_ENV.items():
+        monkeypatch.setenv(name, value)
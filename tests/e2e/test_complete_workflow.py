@@ -9,14 +9,25 @@ These tests simulate real user workflows from start to finish:
 
 Note: These tests require manual intervention for QR scanning
 and should be run in controlled environments.
+
+Progress is logged to the "pyevolution.e2e" logger; run with
+``--log-cli-level=INFO`` (or DEBUG for details) to follow it live.
 """
 
+import logging
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pytest
 
+from pyevolutionapi.exceptions import EvolutionAPIError, RateLimitError
 from pyevolutionapi.models.instance import InstanceStatus
 
+log = logging.getLogger("pyevolution.e2e")
+
+_FAKE_INSTANCE = "non-existent-instance-12345"
+
 
 @pytest.mark.e2e
 class TestCompleteWorkflow:
@@ -38,10 +49,10 @@ class TestCompleteWorkflow:
         test_number = require_test_number
         timeout = e2e_config["timeout"]
 
-        print(f"\n📱 Starting E2E workflow for instance: {instance_name}")
+        log.info("📱 Starting E2E workflow for instance: %s", instance_name)
 
         # Step 1: Create instance
-        print("1️⃣ Creating instance...")
+        log.info("1️⃣ Creating instance...")
         create_response = real_client.instance.create(instance_name=instance_name, qrcode=True)
 
         assert create_response is not None
@@ -50,31 +61,33 @@ class TestCompleteWorkflow:
             InstanceStatus.CONNECTING,
         ]
 
-        print(f"✅ Instance created with status: {create_response.instance.status}")
+        log.debug("✅ Instance created with status: %s", create_response.instance.status)
 
         # Step 2: Get QR code
-        print("2️⃣ Getting QR code...")
+        log.info("2️⃣ Getting QR code...")
         if create_response.qr_code_base64:
-            print("📱 QR Code available - scan with WhatsApp")
-            print(f"QR (truncated): {create_response.qr_code_base64[:50]}...")
+            log.info("📱 QR Code available - scan with WhatsApp")
+            log.debug("QR (truncated): %.50s...", create_response.qr_code_base64)
         else:
-            print("⚠️ No QR code in create response, trying connect...")
+            log.warning("⚠️ No QR code in create response, trying connect...")
             connect_response = real_client.instance.connect(instance_name)
             if connect_response and connect_response.qr_code_base64:
-                print("📱 QR Code from connect - scan with WhatsApp")
-                print(f"QR (truncated): {connect_response.qr_code_base64[:50]}...")
+                log.info("📱 QR Code from connect - scan with WhatsApp")
+                log.debug("QR (truncated): %.50s...", connect_response.qr_code_base64)
             else:
                 pytest.skip("No QR code available from API")
 
         # Step 3: Wait for connection
-        print("3️⃣ Waiting for WhatsApp connection...")
-        print(f"⏱️ Timeout: {timeout//60} minutes")
-        print("📱 Please scan the QR code with WhatsApp now!")
+        log.info("3️⃣ Waiting for WhatsApp connection...")
+        log.info("⏱️ Timeout: %d minutes", timeout // 60)
+        log.info("📱 Please scan the QR code with WhatsApp now!")
 
         connected = False
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        delay = 1.0
+        last_state = None
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 status = real_client.instance.connection_state(instance_name)
 
@@ -83,21 +96,28 @@ class TestCompleteWorkflow:
 
                     if state == "open":
                         connected = True
-                        print("🎉 WhatsApp connected successfully!")
+                        log.info("🎉 WhatsApp connected successfully!")
                         break
                     else:
-                        print(f"📊 Current state: {state}")
+                        log.debug("📊 Current state: %s", state)
+
+                    # Poll quickly again right after a state transition
+                    if state != last_state:
+                        delay = 1.0
+                        last_state = state
 
             except Exception as e:
-                print(f"⚠️ Error checking status: {e}")
+                log.warning("⚠️ Error checking status: %s", e)
 
-            time.sleep(5)  # Check every 5 seconds
+            # Exponential backoff (1s, 1.5s, 2.25s, ... up to 30s) within the timeout
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 1.5, 30.0)
 
         if not connected:
             pytest.skip(f"WhatsApp not connected within {timeout//60} minutes")
 
         # Step 4: Send test message
-        print("4️⃣ Sending test message...")
+        log.info("4️⃣ Sending test message...")
 
         test_message = (
             f"🧪 E2E Test message from PyEvolution at {time.strftime('%Y-%m-%d %H:%M:%S')}"
@@ -108,20 +128,20 @@ class TestCompleteWorkflow:
         )
 
         assert message_response is not None
-        print("✅ Message sent successfully!")
+        log.info("✅ Message sent successfully!")
 
         if hasattr(message_response, "message_id") and message_response.message_id:
-            print(f"📧 Message ID: {message_response.message_id}")
+            log.debug("📧 Message ID: %s", message_response.message_id)
 
         # Step 5: Verify instance still connected
-        print("5️⃣ Verifying connection after message...")
+        log.info("5️⃣ Verifying connection after message...")
 
         final_status = real_client.instance.connection_state(instance_name)
         if isinstance(final_status, dict):
             final_state = final_status.get("state", "unknown")
             assert final_state == "open", f"Connection lost after message: {final_state}"
 
-        print("✅ E2E workflow completed successfully!")
+        log.info("✅ E2E workflow completed successfully!")
 
     def test_instance_lifecycle_without_connection(self, real_client, clean_test_instance):
         """
@@ -130,17 +150,17 @@ class TestCompleteWorkflow:
         """
         instance_name = clean_test_instance
 
-        print(f"\n🔄 Testing instance lifecycle: {instance_name}")
+        log.info("🔄 Testing instance lifecycle: %s", instance_name)
 
         # Create
-        print("1️⃣ Creating instance...")
+        log.info("1️⃣ Creating instance...")
         create_response = real_client.instance.create(instance_name=instance_name, qrcode=True)
 
         assert create_response is not None
-        print(f"✅ Created: {create_response.instance.status}")
+        log.debug("✅ Created: %s", create_response.instance.status)
 
         # Fetch from list
-        print("2️⃣ Fetching from instances list...")
+        log.info("2️⃣ Fetching from instances list...")
         instances = real_client.instance.fetch_instances()
 
         our_instance = None
@@ -153,61 +173,68 @@ class TestCompleteWorkflow:
                 break
 
         assert our_instance is not None, "Instance not found in list"
-        print(f"✅ Found in list: {our_instance.id}")
+        log.debug("✅ Found in list: %s", our_instance.id)
 
         # Check connection state
-        print("3️⃣ Checking connection state...")
+        log.info("3️⃣ Checking connection state...")
         try:
             status = real_client.instance.connection_state(instance_name)
             assert status is not None
-            print(f"✅ Status retrieved: {type(status)}")
+            log.debug("✅ Status retrieved: %s", type(status))
         except Exception as e:
-            print(f"⚠️ Status check failed (acceptable): {e}")
+            log.warning("⚠️ Status check failed (acceptable): %s", e)
 
         # Restart (if supported)
-        print("4️⃣ Testing restart...")
+        log.info("4️⃣ Testing restart...")
         try:
             real_client.instance.restart(instance_name)
-            print("✅ Restart command accepted")
-            time.sleep(2)  # Wait for restart
-        except Exception as e:
-            print(f"⚠️ Restart failed (may not be supported): {e}")
-
-        print("✅ Instance lifecycle test completed!")
-
-    def test_error_handling_workflow(self, real_client):
-        """Test error handling in typical workflows."""
+            log.debug("✅ Restart command accepted")
 
-        print("\n❌ Testing error handling scenarios...")
-
-        # Test 1: Non-existent instance operations
-        print("1️⃣ Testing non-existent instance operations...")
-
-        fake_instance = "non-existent-instance-12345"
-
-        try:
-            status = real_client.instance.connection_state(fake_instance)
-            # Some APIs return empty response, others error - both acceptable
-            print(f"⚠️ Non-existent instance returned: {type(status)}")
-        except Exception as e:
-            print(f"✅ Non-existent instance error handled: {type(e).__name__}")
-
-        try:
-            real_client.instance.delete(fake_instance)
-            print("⚠️ Delete non-existent succeeded (unusual but acceptable)")
+            # Wait until the instance is back up (open or connecting), up to 2s
+            for _ in range(20):
+                try:
+                    response = real_client.instance.connection_state(instance_name)
+                    state = response.get("state") or (response.get("instance") or {}).get("state")
+                except Exception:
+                    state = None  # Not answering while it restarts
+                if state in ("open", "connecting"):
+                    break
+                time.sleep(0.1)
+            log.debug("State after restart: %s", state)
         except Exception as e:
-            print(f"✅ Delete non-existent error handled: {type(e).__name__}")
-
-        # Test 2: Invalid parameters
-        print("2️⃣ Testing invalid parameters...")
-
+            log.warning("⚠️ Restart failed (may not be supported): %s", e)
+
+        log.info("✅ Instance lifecycle test completed!")
+
+    @pytest.mark.parametrize(
+        "operation, expected_errors",
+        [
+            pytest.param(
+                lambda client: client.instance.connection_state(_FAKE_INSTANCE),
+                EvolutionAPIError,
+                id="status-non-existent",
+            ),
+            pytest.param(
+                lambda client: client.instance.delete(_FAKE_INSTANCE),
+                EvolutionAPIError,
+                id="delete-non-existent",
+            ),
+            pytest.param(
+                lambda client: client.instance.create(instance_name="", qrcode=True),
+                (EvolutionAPIError, ValueError),  # ValueError: local model validation
+                id="create-empty-name",
+            ),
+        ],
+    )
+    def test_error_handling_workflow(self, real_client, operation, expected_errors):
+        """Test error handling in typical workflows."""
+        # Some APIs return an empty response, others an error - both acceptable,
+        # as long as errors come out as handled exceptions
         try:
-            real_client.instance.create(instance_name="", qrcode=True)  # Empty name
-            print("⚠️ Empty instance name accepted (unusual)")
-        except Exception as e:
-            print(f"✅ Empty name error handled: {type(e).__name__}")
-
-        print("✅ Error handling workflow completed!")
+            result = operation(real_client)
+            log.debug("⚠️ Operation accepted (unusual but acceptable): %s", type(result))
+        except expected_errors as e:
+            log.debug("✅ Error handled: %s", type(e).__name__)
 
 
 @pytest.mark.e2e
@@ -216,35 +243,59 @@ class TestPerformanceWorkflow:
     """Test performance aspects of complete workflows."""
 
     def test_multiple_instance_creation(self, real_client):
-        """Test creating multiple instances in sequence."""
-        print("\n⚡ Testing multiple instance creation...")
+        """Test creating multiple instances concurrently."""
+        log.info("⚡ Testing multiple instance creation...")
 
+        base_name = f"perf-test-{int(time.time())}"
+        instance_names = [f"{base_name}-{i}" for i in range(3)]
         created_instances = []
 
+        def create(instance_name):
+            # Small jitter so the requests don't hit the API as a single burst
+            time.sleep(random.uniform(0, 0.3))
+            start_time = time.monotonic()
+            response = real_client.instance.create(instance_name=instance_name, qrcode=True)
+            return response, time.monotonic() - start_time
+
+        def delete(instance_name):
+            try:
+                real_client.instance.delete(instance_name)
+                log.debug("🗑️ Deleted: %s", instance_name)
+            except Exception as e:
+                log.warning("⚠️ Failed to delete %s: %s", instance_name, e)
+
         try:
-            for i in range(3):
-                instance_name = f"perf-test-{int(time.time())}-{i}"
+            rate_limited = []
 
-                start_time = time.time()
-                response = real_client.instance.create(instance_name=instance_name, qrcode=True)
-                elapsed = time.time() - start_time
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {executor.submit(create, name): name for name in instance_names}
 
-                assert response is not None
-                created_instances.append(instance_name)
+                for future in as_completed(futures, timeout=60):
+                    instance_name = futures[future]
+                    try:
+                        response, elapsed = future.result()
+                    except RateLimitError:
+                        rate_limited.append(instance_name)
+                        continue
 
-                print(f"✅ Instance {i+1} created in {elapsed:.2f}s")
+                    assert response is not None
+                    created_instances.append(instance_name)
+                    log.debug("✅ Instance %s created in %.2fs", instance_name, elapsed)
 
-                # Small delay to avoid rate limiting
+            # Rate limited: fall back to creating the rest in sequence
+            for instance_name in rate_limited:
                 time.sleep(1)
+                response, elapsed = create(instance_name)
+
+                assert response is not None
+                created_instances.append(instance_name)
+                log.debug("✅ Instance %s created in %.2fs (serial)", instance_name, elapsed)
 
         finally:
-            # Cleanup
-            print("🧹 Cleaning up test instances...")
-            for instance_name in created_instances:
-                try:
-                    real_client.instance.delete(instance_name)
-                    print(f"🗑️ Deleted: {instance_name}")
-                except Exception as e:
-                    print(f"⚠️ Failed to delete {instance_name}: {e}")
+            # Cleanup every submitted name: a future still running when as_completed
+            # timed out may have created its instance after we stopped waiting
+            log.info("🧹 Cleaning up test instances...")
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(delete, instance_names))
 
-        print(f"✅ Created and cleaned up {len(created_instances)} instances")
+        log.info("✅ Created and cleaned up %d instances", len(created_instances))
@@ -10,87 +10,100 @@ Configure as variáveis de ambiente necessárias:
 
 import os
 import time
-from typing import Generator
+from typing import Callable, Generator, Optional, Tuple, TypeVar
+from uuid import uuid4
 
 import pytest
 
 from pyevolutionapi import EvolutionClient
-from pyevolutionapi.models.instance import ConnectionState, InstanceStatus
+from pyevolutionapi.models.instance import (
+    ConnectionState,
+    InstanceResponse,
+    InstanceStatus,
+)
+from tests.utils.test_helpers import debug_caching, real_api_client
 
+T = TypeVar("T")
 
-@pytest.fixture(scope="session")
-def api_config():
-    """Configuração da API real para testes de integração."""
-    base_url = os.getenv("EVOLUTION_BASE_URL", "http://localhost:8080")
-    api_key = os.getenv("EVOLUTION_API_KEY")
+# Prefixo único da execução, compartilhado pelos workers do pytest-xdist (mesmo
+# PYTEST_XDIST_TESTRUNUID); os sufixos aleatórios por teste evitam colisões de nome
+_SESSION_TAG = os.getenv("PYTEST_XDIST_TESTRUNUID", uuid4().hex)[:8]
+_INSTANCE_PREFIX = "pytest-"
+
+
+@pytest.fixture(scope="module")
+def test_instance_name(request):
+    """Nome base das instâncias de teste do módulo."""
+    module = request.module.__name__.rsplit(".", 1)[-1]
+    return os.getenv("EVOLUTION_TEST_INSTANCE", f"{_INSTANCE_PREFIX}{_SESSION_TAG}-{module}")
 
-    if not api_key:
-        pytest.skip("EVOLUTION_API_KEY não configurado - pulando testes de integração")
 
-    return {
-        "base_url": base_url,
-        "api_key": api_key,
-        "timeout": 60.0,  # Timeout maior para testes reais
-    }
+@debug_caching
+def _fetch_all_instances(base_url: str, api_key: str):
+    """Busca a lista de instâncias (cacheada em disco com DEBUG_CACHING)."""
+    return real_api_client(base_url, api_key).instance.fetch_instances()
 
 
 @pytest.fixture(scope="session")
-def real_client(api_config):
-    """Cliente configurado para usar API real."""
-    client = EvolutionClient(
-        base_url=api_config["base_url"],
-        api_key=api_config["api_key"],
-        timeout=api_config["timeout"],
-        debug=True,  # Habilita logs para debug
-    )
-
-    # Testa se API está acessível
-    try:
-        health = client.health_check()
-
-        # health_check pode retornar boolean ou dict
-        if isinstance(health, dict):
-            if not health.get("status") == "ok":
-                pytest.skip("Evolution API não está acessível")
-        elif isinstance(health, bool):
-            if not health:
-                pytest.skip("Evolution API não está acessível")
-        else:
-            # Se retornou algo inesperado, considera como inacessível
-            pytest.skip("Evolution API retornou resposta inesperada")
+def all_instances(real_client):
+    """Lista de instâncias buscada uma única vez e compartilhada pelos testes de leitura."""
+    return _fetch_all_instances(real_client.base_url, real_client.api_key)
 
-    except Exception as e:
-        pytest.skip(f"Evolution API não está acessível: {e}")
 
-    yield client
+@pytest.fixture(scope="module")
+def module_test_instance(test_instance_name) -> str:
+    """
+    Nome base das instâncias de teste do módulo.
 
+    Cada teste deriva dele um nome com sufixo aleatório, então não há sobras de
+    execuções anteriores a remover antes dos testes.
 
-@pytest.fixture
-def test_instance_name():
-    """Nome da instância para testes."""
-    return os.getenv("EVOLUTION_TEST_INSTANCE", f"pytest-{int(time.time())}")
+    Returns:
+        str: Nome base das instâncias de teste
+    """
+    return test_instance_name
 
 
 @pytest.fixture
-def clean_test_instance(real_client, test_instance_name) -> Generator[str, None, None]:
+def clean_test_instance(real_client, module_test_instance) -> Generator[str, None, None]:
     """
-    Fixture que cria uma instância limpa para testes e faz cleanup após o teste.
+    Fixture que fornece um nome de instância exclusivo do teste e faz cleanup após o teste.
+
+    O nome deriva do nome base do módulo com um sufixo aleatório, então não há
+    sobras a remover antes do teste.
 
     Yields:
-        str: Nome da instância criada
+        str: Nome da instância para o teste
     """
-    instance_name = test_instance_name
+    instance_name = f"{module_test_instance}-{uuid4().hex[:6]}"
+
+    yield instance_name
 
-    # Cleanup antes do teste (caso tenha ficado de testes anteriores)
+    # Cleanup após o teste (apenas a instância deste teste)
     try:
         real_client.instance.delete(instance_name)
-        time.sleep(2)  # Aguarda cleanup
     except Exception:
-        pass  # Ignora erros de cleanup inicial
+        pass  # Ignora erros de cleanup final
 
-    yield instance_name
 
-    # Cleanup após o teste
+@pytest.fixture(scope="class")
+def shared_test_instance(
+    real_client, module_test_instance
+) -> Generator[Tuple[str, InstanceResponse], None, None]:
+    """
+    Cria uma instância real compartilhada pelos testes da classe e faz cleanup no fim.
+
+    Use apenas em testes que não alteram o estado da instância (sem connect, restart
+    ou logout); os demais continuam usando clean_test_instance.
+
+    Yields:
+        Tuple[str, InstanceResponse]: Nome da instância e resposta da criação
+    """
+    instance_name = f"{module_test_instance}-{uuid4().hex[:6]}"
+    response = real_client.instance.create(instance_name=instance_name, qrcode=True)
+
+    yield instance_name, response
+
     try:
         real_client.instance.delete(instance_name)
     except Exception:
@@ -129,9 +142,47 @@ def connected_instance(real_client, clean_test_instance) -> Generator[str, None,
     yield instance_name
 
 
+# Intervalo máximo entre verificações nos helpers de espera (backoff exponencial)
+_MAX_POLL_DELAY = 5.0
+
+
 class IntegrationTestHelper:
     """Helper class com métodos úteis para testes de integração."""
 
+    @staticmethod
+    def await_condition(
+        condition: Callable[[], T],
+        timeout: float = 10.0,
+        initial: float = 0.05,
+        cap: float = 1.0,
+    ) -> Optional[T]:
+        """
+        Verifica a condição com backoff curto (50ms, 100ms, ... até 1s).
+
+        Substitui esperas fixas: retorna assim que a API fica pronta.
+
+        Args:
+            condition: Função chamada a cada verificação; erros são ignorados
+            timeout: Timeout em segundos
+            initial: Primeiro intervalo entre verificações
+            cap: Intervalo máximo entre verificações
+
+        Returns:
+            Primeiro resultado verdadeiro da condição, ou None se timeout
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial
+        while time.monotonic() < deadline:
+            try:
+                result = condition()
+                if result:
+                    return result
+            except Exception:
+                pass
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 2, cap)
+        return None
+
     @staticmethod
     def wait_for_status(
         client: EvolutionClient,
@@ -151,17 +202,20 @@ class IntegrationTestHelper:
         Returns:
             bool: True se status foi atingido, False se timeout
         """
-        for _ in range(timeout):
+        deadline = time.monotonic() + timeout
+        delay = 1.0
+        while time.monotonic() < deadline:
             try:
-                instances = client.instance.fetch_instances()
-                for instance in instances.instances or []:
-                    if instance.instance_name == instance_name:
-                        if instance.status == expected_status:
-                            return True
-                        break
+                # Índice por nome montado uma vez por verificação; a busca usa o
+                # cache do próprio recurso (cache_ttl), invalidado em mutações
+                by_name = {i.name: i for i in client.instance.fetch_instances()}
+                instance = by_name.get(instance_name)
+                if instance is not None and instance.status == expected_status:
+                    return True
             except Exception:
                 pass
-            time.sleep(1)
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 1.5, _MAX_POLL_DELAY)
         return False
 
     @staticmethod
@@ -183,32 +237,21 @@ class IntegrationTestHelper:
         Returns:
             bool: True se estado foi atingido, False se timeout
         """
-        for _ in range(timeout):
+        deadline = time.monotonic() + timeout
+        delay = 1.0
+        while time.monotonic() < deadline:
             try:
                 status = client.instance.connection_state(instance_name)
                 if status.get("state") == expected_state.value:
                     return True
             except Exception:
                 pass
-            time.sleep(1)
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 1.5, _MAX_POLL_DELAY)
         return False
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def integration_helper():
     """Fixture que fornece helper methods para testes de integração."""
     return IntegrationTestHelper
-
-
-# Markers para diferentes tipos de testes de integração
-
-
-def pytest_configure(config):
-    """Configura markers personalizados."""
-    config.addinivalue_line(
-        "markers", "integration: marca testes que usam API real (podem ser lentos)"
-    )
-    config.addinivalue_line(
-        "markers", "requires_qr: marca testes que requerem escaneamento manual de QR"
-    )
-    config.addinivalue_line("markers", "slow: marca testes que são lentos (>10s)")
@@ -5,6 +5,7 @@ Tests to ensure PyEvolution API works correctly with different versions
 and configurations of the Evolution API.
 """
 
+import concurrent.futures
 import time
 
 import pytest
@@ -13,6 +14,7 @@ from pyevolutionapi.models.instance import InstanceStatus
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("readonly")
 class TestAPICompatibility:
     """Test compatibility with Evolution API versions."""
 
@@ -31,10 +33,10 @@ class TestAPICompatibility:
         except Exception as e:
             pytest.skip(f"API health check failed: {e}")
 
-    def test_instance_endpoints_available(self, real_client):
+    def test_instance_endpoints_available(self, all_instances):
         """Test that core instance endpoints are available."""
         # Test fetch_instances (should always work)
-        instances = real_client.instance.fetch_instances()
+        instances = all_instances
         assert isinstance(instances, list)
 
         # Each instance should be parseable
@@ -44,16 +46,16 @@ class TestAPICompatibility:
             if instance.status:
                 assert isinstance(instance.status, (InstanceStatus, str))
 
-    def test_different_response_formats(self, real_client):
+    def test_different_response_formats(self, all_instances):
         """Test handling of different response formats from Evolution API."""
         # Some API versions return different formats
-        instances = real_client.instance.fetch_instances()
+        instances = all_instances
 
         if instances:
             # Test parsing various field combinations
             for instance in instances[:3]:  # Test first 3 to avoid rate limits
-                # Fields that might be present
-                fields_to_check = [
+                # Fields that might be present (value may be None)
+                fields_to_check = {
                     "id",
                     "instance_name",
                     "status",
@@ -61,12 +63,11 @@ class TestAPICompatibility:
                     "integration",
                     "profile_name",
                     "Setting",
-                ]
+                }
 
-                for field in fields_to_check:
-                    value = getattr(instance, field, "MISSING")
-                    # Should not raise exception accessing these fields
-                    assert value != "ERROR"  # If getter raises exception, this would fail
+                # A single dump serializes every field; it would raise if any failed
+                fields = instance.model_dump()
+                assert fields_to_check <= fields.keys()
 
     def test_api_error_handling(self, real_client):
         """Test that API errors are handled gracefully."""
@@ -84,21 +85,25 @@ class TestAPICompatibility:
         """Test that rate limiting is handled properly."""
         # Make several quick requests to test rate limiting
         results = []
+        backoff = 0.0  # Only pace requests once the API starts rejecting them
 
         for _ in range(3):
             try:
-                instances = real_client.instance.fetch_instances()
+                instances = real_client.instance.fetch_instances(force=True)
                 results.append(len(instances))
-                time.sleep(0.5)  # Small delay between requests
+                backoff /= 2
             except Exception as e:
                 # Rate limiting should be handled gracefully
                 if "429" in str(e) or "rate" in str(e).lower():
-                    # This is expected and handled
-                    break
+                    # This is expected and handled: back off and try again
+                    backoff = max(0.1, backoff * 2)
                 else:
                     # Other errors should be investigated
                     raise
 
+            if backoff:
+                time.sleep(backoff)
+
         # Should have gotten at least one successful response
         assert len(results) >= 1
 
@@ -107,10 +112,10 @@ class TestAPICompatibility:
 class TestDataConsistency:
     """Test data consistency across different API endpoints."""
 
-    def test_instance_data_consistency(self, real_client):
+    def test_instance_data_consistency(self, real_client, all_instances):
         """Test that instance data is consistent across endpoints."""
         # Get instances from list endpoint
-        instances = real_client.instance.fetch_instances()
+        instances = all_instances
 
         if not instances:
             pytest.skip("No instances available for consistency testing")
@@ -167,6 +172,7 @@ class TestDataConsistency:
 
 @pytest.mark.integration
 @pytest.mark.slow
+@pytest.mark.xdist_group("readonly")
 class TestAPIPerformance:
     """Test API performance and responsiveness."""
 
@@ -187,7 +193,6 @@ class TestAPIPerformance:
 
     def test_concurrent_requests_handling(self, real_client):
         """Test that multiple requests don't cause issues."""
-        import concurrent.futures
 
         def fetch_instances():
             return real_client.instance.fetch_instances()
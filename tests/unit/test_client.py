@@ -2,7 +2,8 @@
 Tests for the main Evolution API client.
 """
 
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import patch
 
 import httpx
 import pytest
@@ -10,6 +11,36 @@ import pytest
 from pyevolutionapi import EvolutionClient
 from pyevolutionapi.exceptions import AuthenticationError, NotFoundError, ValidationError
 
+# Keep the mocked client tests on one xdist worker (--dist=loadgroup) so the
+# module-scoped transport client is built once
+pytestmark = pytest.mark.xdist_group("mock")
+
+# Canned responses served by the mock transport, keyed by request path
+_ROUTES = {
+    "/test-endpoint": (200, {"status": "success"}),
+    "/unauthorized": (401, {"message": "Unauthorized"}),
+    "/not-found": (404, {"message": "Not Found"}),
+    "/bad-request": (400, {"message": "Validation Error"}),
+}
+_ROUTE_BODIES = {
+    path: (status, json.dumps(body).encode()) for path, (status, body) in _ROUTES.items()
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    status, content = _ROUTE_BODIES[request.url.path]
+    return httpx.Response(status, content=content, headers={"Content-Type": "application/json"})
+
+
+@pytest.fixture(scope="module")
+def transport_client(mock_base_url, mock_api_key):
+    """Client whose requests are answered in-process by httpx.MockTransport."""
+    client = EvolutionClient(
+        base_url=mock_base_url, api_key=mock_api_key, transport=httpx.MockTransport(_handler)
+    )
+    yield client
+    client.close()
+
 
 class TestEvolutionClient:
     """Test cases for EvolutionClient."""
@@ -26,6 +57,26 @@ class TestEvolutionClient:
         assert client.timeout == 30.0
         assert client.max_retries == 3
 
+    def test_connection_pool_limits(self, mock_base_url, mock_api_key):
+        """Test connection pool limits default and override."""
+        client = EvolutionClient(base_url=mock_base_url, api_key=mock_api_key)
+
+        assert client.limits.max_connections == 64
+        assert client.limits.max_keepalive_connections == 32
+        assert client.limits.keepalive_expiry == 30.0
+
+        client = EvolutionClient(
+            base_url=mock_base_url,
+            api_key=mock_api_key,
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=5.0,
+        )
+
+        assert client.limits == httpx.Limits(
+            max_connections=10, max_keepalive_connections=5, keepalive_expiry=5.0
+        )
+
     def test_client_initialization_from_env(self, monkeypatch):
         """Test client initialization from environment variables."""
         monkeypatch.setenv("EVOLUTION_BASE_URL", "http://test.com")
@@ -49,15 +100,12 @@ class TestEvolutionClient:
         assert hasattr(client, "profile")
         assert hasattr(client, "webhook")
 
-    @patch("httpx.Client.request")
-    def test_successful_request(self, mock_request, client, mock_response):
+    def test_successful_request(self, transport_client):
         """Test successful API request."""
-        mock_request.return_value = mock_response
-
-        response = client.request("GET", "/test-endpoint")
+        response = transport_client.request("GET", "/test-endpoint")
 
-        assert response == mock_response
-        mock_request.assert_called_once()
+        assert response.status_code == 200
+        assert response.json() == {"status": "success"}
 
     @patch("httpx.Client.request")
     def test_request_with_instance_placeholder(self, mock_request, client, mock_response):
@@ -71,49 +119,59 @@ class TestEvolutionClient:
         assert "my-instance" in call_args.kwargs["url"]
 
     @patch("httpx.Client.request")
-    def test_authentication_error_handling(self, mock_request, client):
-        """Test handling of 401 authentication errors."""
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 401
-        mock_response.is_success = False
-        mock_response.json.return_value = {"message": "Unauthorized"}
-        mock_response.text = '{"message": "Unauthorized"}'
+    def test_request_json_body(self, mock_request, client, mock_response):
+        """Test that JSON bodies are serialized before sending."""
         mock_request.return_value = mock_response
 
-        with pytest.raises(AuthenticationError) as exc_info:
-            client.request("GET", "/test-endpoint")
+        client.request("POST", "/test-endpoint", json={"text": "olá"})
+
+        call_kwargs = mock_request.call_args.kwargs
+        body = call_kwargs.get("content") or json.dumps(call_kwargs["json"]).encode()
+        assert json.loads(body) == {"text": "olá"}
 
-        assert exc_info.value.status_code == 401
+    @pytest.mark.parametrize(
+        "endpoint, exc",
+        [
+            ("/unauthorized", AuthenticationError),
+            ("/not-found", NotFoundError),
+            ("/bad-request", ValidationError),
+        ],
+    )
+    def test_status_error_handling(self, transport_client, endpoint, exc):
+        """Test that 4xx responses raise the matching exception."""
+        status, body = _ROUTES[endpoint]
+
+        with pytest.raises(exc) as exc_info:
+            transport_client.request("GET", endpoint)
+
+        assert exc_info.value.status_code == status
+        assert exc_info.value.message == body["message"]
 
     @patch("httpx.Client.request")
-    def test_not_found_error_handling(self, mock_request, client):
-        """Test handling of 404 not found errors."""
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 404
-        mock_response.is_success = False
-        mock_response.json.return_value = {"message": "Not Found"}
-        mock_response.text = '{"message": "Not Found"}'
-        mock_request.return_value = mock_response
+    def test_error_from_http_response(self, mock_request, client):
+        """Test error details are parsed from a raw HTTP response body."""
+        mock_request.return_value = httpx.Response(404, content=b'{"message": "Not Found"}')
 
         with pytest.raises(NotFoundError) as exc_info:
             client.request("GET", "/test-endpoint")
 
-        assert exc_info.value.status_code == 404
+        assert exc_info.value.response_data == {"message": "Not Found"}
 
+    @patch("time.sleep")
     @patch("httpx.Client.request")
-    def test_validation_error_handling(self, mock_request, client):
-        """Test handling of 400 validation errors."""
-        mock_response = Mock(spec=httpx.Response)
-        mock_response.status_code = 400
-        mock_response.is_success = False
-        mock_response.json.return_value = {"message": "Validation Error"}
-        mock_response.text = '{"message": "Validation Error"}'
-        mock_request.return_value = mock_response
+    def test_rate_limit_retry_after(
+        self, mock_request, mock_sleep, client, mock_response, make_error_response
+    ):
+        """Test that a 429 with Retry-After is retried once."""
+        rate_limited = make_error_response(429, {"message": "Too Many Requests"})
+        rate_limited.headers["Retry-After"] = "2"
+        mock_request.side_effect = [rate_limited, mock_response]
 
-        with pytest.raises(ValidationError) as exc_info:
-            client.request("GET", "/test-endpoint")
+        response = client.request("GET", "/test-endpoint")
 
-        assert exc_info.value.status_code == 400
+        assert response == mock_response
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
 
     @patch("httpx.Client.request")
     def test_timeout_error_handling(self, mock_request, client):
@@ -128,23 +186,21 @@ class TestEvolutionClient:
         with EvolutionClient(base_url=mock_base_url, api_key=mock_api_key) as client:
             assert isinstance(client, EvolutionClient)
 
-    def test_health_check_success(self, client):
-        """Test successful health check."""
+    @pytest.mark.parametrize(
+        "side_effect, expected",
+        [
+            (None, True),
+            (Exception("Connection failed"), False),
+        ],
+        ids=["success", "failure"],
+    )
+    def test_health_check(self, client, side_effect, expected):
+        """Test health check result for a reachable and an unreachable API."""
         with patch.object(client._client, "get") as mock_get:
-            mock_response = Mock()
-            mock_response.is_success = True
-            mock_get.return_value = mock_response
+            mock_get.return_value.is_success = True
+            mock_get.side_effect = side_effect
 
             result = client.health_check()
 
-            assert result is True
+            assert result is expected
             mock_get.assert_called_once_with("/")
-
-    def test_health_check_failure(self, client):
-        """Test failed health check."""
-        with patch.object(client._client, "get") as mock_get:
-            mock_get.side_effect = Exception("Connection failed")
-
-            result = client.health_check()
-
-            assert result is False
@@ -38,9 +38,7 @@ class TestInstanceStatus:
             "DELETED": "deleted",
         }
 
-        for attr_name, value in expected_statuses.items():
-            assert hasattr(InstanceStatus, attr_name)
-            assert getattr(InstanceStatus, attr_name).value == value
+        assert expected_statuses.items() <= {s.name: s.value for s in InstanceStatus}.items()
 
 
 class TestInstanceModel:
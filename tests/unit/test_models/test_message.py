@@ -2,37 +2,50 @@
 Unit tests for message models.
 """
 
+import pytest
+
 from pyevolutionapi.models.message import MediaMessage, MessageResponse, MessageType, TextMessage
 
+# (message class, constructor kwargs, expected subset of model_dump(mode="json"))
+MESSAGE_CASES = [
+    pytest.param(
+        TextMessage,
+        {"number": "5511999999999", "text": "Hello World!"},
+        {"number": "5511999999999", "text": "Hello World!", "delay": None},
+        id="text",
+    ),
+    pytest.param(
+        TextMessage,
+        {"number": "5511999999999", "text": "Delayed message", "delay": 5000},
+        {"delay": 5000},
+        id="text-with-delay",
+    ),
+    pytest.param(
+        MediaMessage,
+        {
+            "number": "5511999999999",
+            "mediatype": MessageType.IMAGE,
+            "media": "https://example.com/image.jpg",
+        },
+        {
+            "number": "5511999999999",
+            "mediatype": MessageType.IMAGE,
+            "media": "https://example.com/image.jpg",
+        },
+        id="media",
+    ),
+]
+
 
 class TestMessageModels:
     """Test message model validation and functionality."""
 
-    def test_text_message_creation(self):
-        """Test creating a text message."""
-        message = TextMessage(number="5511999999999", text="Hello World!")
-
-        assert message.number == "5511999999999"
-        assert message.text == "Hello World!"
-        assert message.delay is None
-
-    def test_text_message_with_delay(self):
-        """Test text message with delay."""
-        message = TextMessage(number="5511999999999", text="Delayed message", delay=5000)
-
-        assert message.delay == 5000
-
-    def test_media_message_creation(self):
-        """Test creating a media message."""
-        message = MediaMessage(
-            number="5511999999999",
-            mediatype=MessageType.IMAGE,
-            media="https://example.com/image.jpg",
-        )
+    @pytest.mark.parametrize("message_cls, kwargs, expected", MESSAGE_CASES)
+    def test_message_creation(self, message_cls, kwargs, expected):
+        """Test creating text and media messages."""
+        message = message_cls(**kwargs)
 
-        assert message.number == "5511999999999"
-        assert message.mediatype == MessageType.IMAGE
-        assert str(message.media) == "https://example.com/image.jpg"
+        assert expected.items() <= message.model_dump(mode="json").items()
 
     def test_message_response_parsing(self):
         """Test message response parsing."""
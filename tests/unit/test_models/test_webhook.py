@@ -2,6 +2,8 @@
 Unit tests for webhook models.
 """
 
+import pytest
+
 from pyevolutionapi.models.webhook import (
     RabbitmqConfig,
     SqsConfig,
@@ -10,57 +12,63 @@ from pyevolutionapi.models.webhook import (
     WebsocketConfig,
 )
 
+# (config class, constructor kwargs, expected subset of model_dump(mode="json"))
+CONFIG_CASES = [
+    pytest.param(
+        WebhookConfig,
+        {
+            "url": "https://api.example.com/webhook",
+            "events": [WebhookEvent.MESSAGES_UPSERT, WebhookEvent.SEND_MESSAGE],
+            "webhook_by_events": True,
+        },
+        {
+            "url": "https://api.example.com/webhook",
+            "events": [WebhookEvent.MESSAGES_UPSERT, WebhookEvent.SEND_MESSAGE],
+            "webhook_by_events": True,
+        },
+        id="webhook",
+    ),
+    pytest.param(
+        WebhookConfig,
+        {
+            "url": "https://api.example.com/webhook",
+            "events": [WebhookEvent.MESSAGES_UPSERT],
+            "webhook_base64": True,
+            "headers": {"Authorization": "Bearer token123", "Content-Type": "application/json"},
+        },
+        {
+            "webhook_base64": True,
+            "headers": {"Authorization": "Bearer token123", "Content-Type": "application/json"},
+        },
+        id="webhook-with-headers",
+    ),
+    pytest.param(
+        WebsocketConfig,
+        {"enabled": True, "events": [WebhookEvent.MESSAGES_UPSERT]},
+        {"enabled": True, "events": [WebhookEvent.MESSAGES_UPSERT]},
+        id="websocket",
+    ),
+    pytest.param(
+        RabbitmqConfig,
+        {"enabled": True, "events": [WebhookEvent.MESSAGES_UPSERT, WebhookEvent.SEND_MESSAGE]},
+        {"enabled": True},
+        id="rabbitmq",
+    ),
+    pytest.param(
+        SqsConfig,
+        {"enabled": True, "events": [WebhookEvent.MESSAGES_UPSERT, WebhookEvent.SEND_MESSAGE]},
+        {"enabled": True},
+        id="sqs",
+    ),
+]
+
 
 class TestWebhookModels:
     """Test webhook model validation and functionality."""
 
-    def test_webhook_config_creation(self):
-        """Test creating webhook configuration."""
-        config = WebhookConfig(
-            url="https://api.example.com/webhook",
-            events=[WebhookEvent.MESSAGES_UPSERT, WebhookEvent.SEND_MESSAGE],
-            webhook_by_events=True,
-        )
-
-        assert str(config.url) == "https://api.example.com/webhook"
-        assert WebhookEvent.MESSAGES_UPSERT in config.events
-        assert WebhookEvent.SEND_MESSAGE in config.events
-        assert config.webhook_by_events is True
-
-    def test_webhook_config_with_headers(self):
-        """Test webhook config with custom headers."""
-        config = WebhookConfig(
-            url="https://api.example.com/webhook",
-            events=[WebhookEvent.MESSAGES_UPSERT],
-            webhook_base64=True,
-            headers={"Authorization": "Bearer token123", "Content-Type": "application/json"},
-        )
-
-        assert config.webhook_base64 is True
-        assert config.headers["Authorization"] == "Bearer token123"
-        assert config.headers["Content-Type"] == "application/json"
-
-    def test_websocket_config_creation(self):
-        """Test WebSocket configuration."""
-        config = WebsocketConfig(enabled=True, events=[WebhookEvent.MESSAGES_UPSERT])
-
-        assert config.enabled is True
-        assert WebhookEvent.MESSAGES_UPSERT in config.events
-
-    def test_rabbitmq_config_creation(self):
-        """Test RabbitMQ configuration."""
-        config = RabbitmqConfig(
-            enabled=True,
-            events=[WebhookEvent.MESSAGES_UPSERT, WebhookEvent.SEND_MESSAGE],
-        )
-
-        assert config.enabled is True
-
-    def test_sqs_config_creation(self):
-        """Test AWS SQS configuration."""
-        config = SqsConfig(
-            enabled=True,
-            events=[WebhookEvent.MESSAGES_UPSERT, WebhookEvent.SEND_MESSAGE],
-        )
+    @pytest.mark.parametrize("config_cls, kwargs, expected", CONFIG_CASES)
+    def test_config_creation(self, config_cls, kwargs, expected):
+        """Test creating webhook, WebSocket, RabbitMQ and SQS configurations."""
+        config = config_cls(**kwargs)
 
-        assert config.enabled is True
+        assert expected.items() <= config.model_dump(mode="json").items()
@@ -2,29 +2,58 @@
 Unit tests for instance resource.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+from pyevolutionapi.exceptions import NotFoundError
 from pyevolutionapi.models.instance import Instance, InstanceResponse, InstanceStatus
 from pyevolutionapi.resources.instance import InstanceResource
 
 
+class _StubClient:
+    """Lightweight client stand-in that records request() calls."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and canned responses."""
+        self.calls = []
+        self.response = None
+        self.responses = []  # Consumed in order before falling back to response
+        self.__dict__.pop("arequest", None)  # Set per test by the async tests
+
+    def request(self, method, endpoint, **kwargs):
+        self.calls.append((method, endpoint, kwargs))
+        result = self.responses.pop(0) if self.responses else self.response
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
 class TestInstanceResource:
     """Test instance resource functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_client(self):
-        """Mock client for testing."""
-        client = Mock()
-        client.request = Mock()
-        return client
+        """Stub client for testing, shared across the module."""
+        return _StubClient()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def instance_resource(self, mock_client):
-        """Instance resource with mocked client."""
+        """Instance resource with mocked client, shared across the module."""
         return InstanceResource(mock_client)
 
+    @pytest.fixture(autouse=True)
+    def _reset(self, mock_client, instance_resource):
+        """Give each test a clean stub client and an uncached resource."""
+        mock_client.reset()
+        instance_resource.cache_ttl = 0.0
+        instance_resource.clear_cache()
+
     def test_create_instance_success(self, instance_resource, mock_client):
         """Test successful instance creation."""
         # Mock response
@@ -39,7 +68,7 @@ class TestInstanceResource:
             "hash": "xyz789",
         }
 
-        mock_client.request.return_value = mock_response
+        mock_client.response = mock_response
 
         # Test
         result = instance_resource.create(instance_name="test-instance", qrcode=True)
@@ -52,10 +81,10 @@ class TestInstanceResource:
         assert result.hash == "xyz789"
 
         # Verify API call
-        mock_client.request.assert_called_once()
-        call_args = mock_client.request.call_args
-        assert call_args[0][0] == "POST"  # Method
-        assert "/instance/create" in call_args[0][1]  # URL
+        assert len(mock_client.calls) == 1
+        method, endpoint, _ = mock_client.calls[0]
+        assert method == "POST"
+        assert "/instance/create" in endpoint
 
     def test_fetch_instances(self, instance_resource, mock_client):
         """Test fetching instances list."""
@@ -75,7 +104,7 @@ class TestInstanceResource:
             },
         ]
 
-        mock_client.request.return_value = mock_response
+        mock_client.response = mock_response
 
         # Test
         result = instance_resource.fetch_instances()
@@ -87,10 +116,91 @@ class TestInstanceResource:
         assert result[0].id == "instance1"
         assert result[1].id == "instance2"
 
+    def test_fetch_instances_wrapped(self, instance_resource, mock_client):
+        """Test fetching instances from an {"instances": [...]} response."""
+        mock_client.response = {"instances": [{"id": "instance1", "status": "connected"}]}
+
+        # Test
+        result = instance_resource.fetch_instances()
+
+        # Assertions
+        assert isinstance(result, list)
+        assert isinstance(result[0], Instance)
+        assert result[0].id == "instance1"
+
+    def test_iter_instances(self, instance_resource, mock_client):
+        """Test lazily iterating over instances."""
+        mock_client.response = {"instances": [{"id": "instance1"}, {"id": "instance2"}]}
+
+        # Test
+        result = instance_resource.iter_instances()
+
+        # Assertions
+        assert not isinstance(result, list)
+        assert [inst.id for inst in result] == ["instance1", "instance2"]
+
+    def test_fetch_instances_trusted(self, instance_resource, mock_client):
+        """Test trusted fetch builds models without validation."""
+        mock_client.response = [
+            {"id": "instance1", "instanceName": "test1", "createdAt": "2024-01-01T00:00:00Z"}
+        ]
+
+        # Test
+        result = instance_resource.fetch_instances(trusted=True)
+
+        # Assertions
+        assert isinstance(result[0], Instance)
+        assert result[0].instance_name == "test1"
+        assert result[0].created_at == "2024-01-01T00:00:00Z"  # Not coerced
+
+    def test_fetch_instances_from_http_response(self, instance_resource, mock_client):
+        """Test parsing a raw HTTP response body."""
+        mock_client.response = httpx.Response(
+            200, content=b'[{"id": "instance1", "instanceName": "test1"}]'
+        )
+
+        # Test
+        result = instance_resource.fetch_instances()
+
+        # Assertions
+        assert [inst.instance_name for inst in result] == ["test1"]
+
+    def test_fetch_instances_cache(self, instance_resource, mock_client):
+        """Test fetch_instances reuses results while the cache is fresh."""
+        mock_client.response = [{"id": "instance1", "instanceName": "test1"}]
+        instance_resource.cache_ttl = 30.0
+
+        # Test
+        first = instance_resource.fetch_instances()
+        second = instance_resource.fetch_instances()
+
+        # Assertions
+        assert [i.id for i in second] == [i.id for i in first]
+        assert len(mock_client.calls) == 1
+
+        # force bypasses the cache and mutations invalidate it
+        instance_resource.fetch_instances(force=True)
+        assert len(mock_client.calls) == 2
+
+        instance_resource.delete("test1")
+        instance_resource.fetch_instances()
+        assert len(mock_client.calls) == 4
+
+    def test_fetch_instances_not_cached_by_default(self, instance_resource, mock_client):
+        """Test fetch_instances always queries the API when caching is disabled."""
+        mock_client.response = []
+
+        # Test
+        instance_resource.fetch_instances()
+        instance_resource.fetch_instances()
+
+        # Assertions
+        assert len(mock_client.calls) == 2
+
     def test_delete_instance(self, instance_resource, mock_client):
         """Test instance deletion."""
         mock_response = {"status": "success", "message": "Instance deleted"}
-        mock_client.request.return_value = mock_response
+        mock_client.response = mock_response
 
         # Test
         result = instance_resource.delete("test-instance")
@@ -99,16 +209,52 @@ class TestInstanceResource:
         assert result["status"] == "success"
 
         # Verify API call
-        mock_client.request.assert_called_once()
-        call_args = mock_client.request.call_args
+        assert len(mock_client.calls) == 1
+        method, endpoint, _ = mock_client.calls[0]
+        assert method == "DELETE"
+        assert "test-instance" in endpoint  # Instance name in URL
+
+    def test_adelete_instance(self, instance_resource, mock_client):
+        """Test async instance deletion."""
+        mock_client.arequest = AsyncMock(return_value={"status": "success"})
+
+        # Test
+        result = asyncio.run(instance_resource.adelete("test-instance"))
+
+        # Assertions
+        assert result["status"] == "success"
+        call_args = mock_client.arequest.call_args
         assert call_args[0][0] == "DELETE"  # Method
         assert "test-instance" in call_args[0][1]  # Instance name in URL
 
+    def test_bulk_delete_collects_errors(self, instance_resource, mock_client):
+        """Test bulk deletion keeps going after a failure."""
+        mock_client.responses = [{"status": "success"}, NotFoundError("Not Found")]
+
+        # Test
+        result = instance_resource.bulk_delete(["inst-a", "inst-b"])
+
+        # Assertions
+        assert result["inst-a"]["status"] == "success"
+        assert isinstance(result["inst-b"], NotFoundError)
+        assert len(mock_client.calls) == 2
+
+    def test_abulk_delete(self, instance_resource, mock_client):
+        """Test async bulk deletion returns a per-instance result map."""
+        mock_client.arequest = AsyncMock(return_value={"status": "success"})
+
+        # Test
+        result = asyncio.run(instance_resource.abulk_delete(["inst-a", "inst-b"], concurrency=1))
+
+        # Assertions
+        assert set(result) == {"inst-a", "inst-b"}
+        assert all(r["status"] == "success" for r in result.values())
+
     def test_connection_state(self, instance_resource, mock_client):
         """Test getting connection state."""
         mock_response = {"instance": {"instanceName": "test-instance", "state": "open"}}
 
-        mock_client.request.return_value = mock_response
+        mock_client.response = mock_response
 
         # Test
         result = instance_resource.connection_state("test-instance")
@@ -124,7 +270,7 @@ class TestInstanceResource:
             "qrcode": {"base64": "data:image/png;base64,abc123", "count": 0},
         }
 
-        mock_client.request.return_value = mock_response
+        mock_client.response = mock_response
 
         # Test
         result = instance_resource.connect("test-instance")
@@ -11,8 +11,11 @@ from .test_helpers import (
     TestDataFactory,
     assert_evolution_response,
     cleanup_test_instances,
+    close_real_api_clients,
+    debug_caching,
     generate_test_instance_name,
     mock_evolution_response,
+    real_api_client,
     wait_for_condition,
 )
 
@@ -23,6 +26,9 @@ __all__ = [
     "assert_evolution_response",
     "wait_for_condition",
     "cleanup_test_instances",
+    "close_real_api_clients",
+    "debug_caching",
+    "real_api_client",
     "MockEvolutionClient",
     "TestDataFactory",
     # From api_helpers
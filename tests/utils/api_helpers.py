@@ -5,12 +5,57 @@ This module contains helpers specifically for testing with real Evolution API,
 including connection monitoring, QR code handling, and API state management.
 """
 
-import base64
+import asyncio
+import binascii
+import os
+import re
 import time
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from pyevolutionapi import EvolutionClient
-from pyevolutionapi.models.instance import ConnectionState, InstanceStatus
+from pyevolutionapi.models.instance import ConnectionState, Instance, InstanceStatus
+
+
+def _connection_state_of(response: Any) -> Optional[str]:
+    """Read the state from a connection_state response (flat or nested under "instance")."""
+    if not isinstance(response, dict):
+        return None
+    state = response.get("state") or (response.get("instance") or {}).get("state")
+    return state.lower() if isinstance(state, str) else None
+
+
+class _InstancesCache:
+    """Short-lived fetch_instances() snapshot shared by the lookups of one polling tick."""
+
+    def __init__(self, client: EvolutionClient, ttl: float = 0.5):
+        self.client = client
+        self.ttl = ttl
+        self._snapshot: Optional[Tuple[float, List[Instance]]] = None
+        self._by_key: Dict[str, Instance] = {}
+
+    def fetch(self) -> List[Instance]:
+        """Return the cached instance list, refetching once it is older than ttl."""
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot[0] >= self.ttl:
+            instances = self.client.instance.fetch_instances()
+            self._snapshot = (now, instances)
+            self._by_key = {}
+            for instance in instances:
+                # Index every identifier an instance can be looked up by
+                for key in (instance.instance_id, instance.id, instance.name):
+                    if key:
+                        self._by_key[key] = instance
+        return self._snapshot[1]
+
+    def get(self, key: str) -> Optional[Instance]:
+        """Look up an instance by name, id or instanceId in the current snapshot."""
+        self.fetch()
+        return self._by_key.get(key)
+
+    def invalidate(self) -> None:
+        """Drop the snapshot after instances are created or deleted."""
+        self._snapshot = None
 
 
 class IntegrationHelper:
@@ -23,7 +68,8 @@ class IntegrationHelper:
 
     def __init__(self, client: EvolutionClient):
         self.client = client
-        self.created_instances: List[str] = []
+        self.created_instances: Set[str] = set()
+        self._instances_cache = _InstancesCache(client)
 
     def wait_for_status(
         self,
@@ -83,34 +129,86 @@ class IntegrationHelper:
 
         while time.time() - start_time < timeout:
             try:
-                # Check via connection_state
-                status = self.client.instance.connection_state(instance_name)
+                # Check via connection_state (single-instance endpoint)
+                state = _connection_state_of(self.client.instance.connection_state(instance_name))
+                if state == ConnectionState.OPEN:
+                    return True
+
+                # Fall back to the full instance list only when the state is unknown
+                if state is None and self._connected_in_list(
+                    self._instances_cache.fetch(), instance_name
+                ):
+                    return True
 
-                if isinstance(status, dict):
-                    state = status.get("state", "").lower()
-                    if state == "open":
-                        return True
+            except Exception:
+                pass  # Ignore API errors
 
-                # Also check via fetch_instances
-                instances = self.client.instance.fetch_instances()
-                for instance in instances:
-                    if instance.name == instance_name or instance.id == instance_name:
+            time.sleep(interval)
 
-                        if hasattr(instance, "state") and instance.state == ConnectionState.OPEN:
-                            return True
+        return False
 
-                        if (
-                            hasattr(instance, "status")
-                            and instance.status == InstanceStatus.CONNECTED
-                        ):
+    async def await_for_status(
+        self,
+        instance_name: str,
+        expected_status: InstanceStatus,
+        timeout: float = 30.0,
+        interval: float = 2.0,
+    ) -> bool:
+        """Async version of wait_for_status; sleeps without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            try:
+                instances = await self.client.instance.afetch_instances()
+
+                for instance in instances:
+                    if instance.name == instance_name or instance.id == instance_name:
+                        if instance.status == expected_status:
                             return True
                         break
 
+            except Exception:
+                pass  # Ignore temporary API errors
+
+            await asyncio.sleep(interval)
+
+        return False
+
+    async def await_for_connection(
+        self, instance_name: str, timeout: float = 60.0, interval: float = 3.0
+    ) -> bool:
+        """Async version of wait_for_connection; sleeps without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            try:
+                state = _connection_state_of(
+                    await self.client.instance.aconnection_state(instance_name)
+                )
+                if state == ConnectionState.OPEN:
+                    return True
+
+                if state is None and self._connected_in_list(
+                    await self.client.instance.afetch_instances(), instance_name
+                ):
+                    return True
+
             except Exception:
                 pass  # Ignore API errors
 
-            time.sleep(interval)
+            await asyncio.sleep(interval)
+
+        return False
 
+    @staticmethod
+    def _connected_in_list(instances: List[Instance], instance_name: str) -> bool:
+        """Check whether the named instance is connected according to fetch_instances."""
+        for instance in instances:
+            if instance.name == instance_name or instance.id == instance_name:
+                return (
+                    instance.state == ConnectionState.OPEN
+                    or instance.status == InstanceStatus.CONNECTED
+                )
         return False
 
     def create_test_instance(
@@ -128,7 +226,9 @@ class IntegrationHelper:
             Creation response or None if failed
         """
         if not instance_name:
-            instance_name = f"test-{int(time.time())}"
+            # Worker suffix keeps pytest-xdist workers from colliding on the same name
+            worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+            instance_name = f"test-{int(time.time())}-{worker}"
 
         try:
             # Try to delete if exists
@@ -140,9 +240,10 @@ class IntegrationHelper:
 
             # Create new instance
             response = self.client.instance.create(instance_name=instance_name, qrcode=qrcode)
+            self._instances_cache.invalidate()
 
             if auto_cleanup:
-                self.created_instances.append(instance_name)
+                self.created_instances.add(instance_name)
 
             return {"instance_name": instance_name, "response": response, "success": True}
 
@@ -157,12 +258,12 @@ class IntegrationHelper:
             instance_names: Specific instances to clean up, or None for all tracked
         """
         names_to_clean = instance_names or self.created_instances.copy()
+        self._instances_cache.invalidate()
 
         for name in names_to_clean:
             try:
                 self.client.instance.delete(name)
-                if name in self.created_instances:
-                    self.created_instances.remove(name)
+                self.created_instances.discard(name)
             except Exception:
                 pass  # Ignore cleanup errors
 
@@ -177,15 +278,9 @@ class IntegrationHelper:
             Instance data or None if not found
         """
         try:
-            instances = self.client.instance.fetch_instances()
-
-            for instance in instances:
-                if (
-                    instance.name == instance_name
-                    or instance.id == instance_name
-                    or (hasattr(instance, "instance_id") and instance.instance_id == instance_name)
-                ):
-                    return {"instance": instance, "found": True}
+            instance = self._instances_cache.get(instance_name)
+            if instance is not None:
+                return {"instance": instance, "found": True}
 
             return {"found": False}
 
@@ -236,6 +331,62 @@ class IntegrationHelper:
         return info
 
 
+# Attribute/key names that may hold the base64 QR code in API responses
+_QR_FIELDS: Tuple[str, ...] = ("qr_code_base64", "qrCodeBase64", "base64")
+
+# Leading bytes that identify the decoded image format
+_IMAGE_MAGIC: Tuple[Tuple[bytes, str], ...] = ((b"\x89PNG", "PNG"), (b"\xff\xd8\xff", "JPEG"))
+
+# "data:image/<format>;base64," prefix; only the prefix is scanned, never the payload
+_DATA_URL_RE = re.compile(r"data:image/([^;,]*)[^,]*,")
+
+
+def _split_qr_data(qr_data: str) -> Tuple[Optional[str], str]:
+    """Split QR data into (image format, base64 payload); format is None without a prefix."""
+    match = _DATA_URL_RE.match(qr_data)
+    if match is None:
+        return None, qr_data
+    return match.group(1), qr_data[match.end() :]
+
+
+@lru_cache(maxsize=256)
+def _decode_qr_base64(base64_part: str) -> bytes:
+    """Decode a base64 payload, reusing the bytes for repeated QR strings."""
+    return binascii.a2b_base64(base64_part)
+
+
+@lru_cache(maxsize=128)
+def _validate_qr_base64(qr_data: str) -> Dict[str, Any]:
+    result = {"valid": False, "format": "unknown", "size": 0, "has_prefix": False}
+
+    if not qr_data:
+        result["error"] = "Empty QR data"
+        return result
+
+    try:
+        image_type, base64_part = _split_qr_data(qr_data)
+        if image_type is not None:
+            result["has_prefix"] = True
+            result["format"] = image_type
+        else:
+            result["format"] = "raw_base64"
+
+        # Try to decode
+        decoded = _decode_qr_base64(base64_part)
+        result["size"] = len(decoded)
+        result["valid"] = True
+
+        # Basic image format detection
+        result["image_format"] = next(
+            (name for magic, name in _IMAGE_MAGIC if decoded.startswith(magic)), "unknown"
+        )
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    return result
+
+
 class QRDisplayHelper:
     """
     Helper for handling QR codes in tests.
@@ -256,26 +407,15 @@ class QRDisplayHelper:
             Base64 QR code data or None
         """
         # Check different possible QR fields
-        qr_fields = ["qr_code_base64", "qrCodeBase64", "base64"]
-
-        for field in qr_fields:
-            if hasattr(response, field):
-                value = getattr(response, field)
-                if value:
-                    return value
+        for field in _QR_FIELDS:
+            value = getattr(response, field, None)
+            if value:
+                return value
 
         # Check qrcode dict
-        if hasattr(response, "qrcode") and response.qrcode:
-            qr_data = response.qrcode
-
-            if isinstance(qr_data, dict):
-                for field in qr_fields:
-                    if field in qr_data and qr_data[field]:
-                        return qr_data[field]
-
-                # Also try 'base64' key specifically
-                if "base64" in qr_data:
-                    return qr_data["base64"]
+        qr_data = getattr(response, "qrcode", None)
+        if isinstance(qr_data, dict):
+            return next((qr_data[field] for field in _QR_FIELDS if qr_data.get(field)), None)
 
         return None
 
@@ -290,41 +430,8 @@ class QRDisplayHelper:
         Returns:
             Validation result dictionary
         """
-        result = {"valid": False, "format": "unknown", "size": 0, "has_prefix": False}
-
-        if not qr_data:
-            result["error"] = "Empty QR data"
-            return result
-
-        try:
-            # Check for data URL prefix
-            if qr_data.startswith("data:image/"):
-                result["has_prefix"] = True
-                result["format"] = qr_data.split(";")[0].split("/")[-1]
-
-                # Extract base64 part
-                base64_part = qr_data.split(",", 1)[-1]
-            else:
-                base64_part = qr_data
-                result["format"] = "raw_base64"
-
-            # Try to decode
-            decoded = base64.b64decode(base64_part)
-            result["size"] = len(decoded)
-            result["valid"] = True
-
-            # Basic image format detection
-            if decoded.startswith(b"\x89PNG"):
-                result["image_format"] = "PNG"
-            elif decoded.startswith(b"\xff\xd8\xff"):
-                result["image_format"] = "JPEG"
-            else:
-                result["image_format"] = "unknown"
-
-        except Exception as e:
-            result["error"] = str(e)
-
-        return result
+        # Cached per QR string; copy so callers can't mutate the cached result
+        return dict(_validate_qr_base64(qr_data))
 
     @staticmethod
     def save_qr_to_file(qr_data: str, filename: str) -> bool:
@@ -339,14 +446,8 @@ class QRDisplayHelper:
             True if saved successfully
         """
         try:
-            # Extract base64 part
-            if qr_data.startswith("data:image/"):
-                base64_part = qr_data.split(",", 1)[-1]
-            else:
-                base64_part = qr_data
-
             # Decode and save
-            decoded = base64.b64decode(base64_part)
+            decoded = _decode_qr_base64(_split_qr_data(qr_data)[1])
 
             with open(filename, "wb") as f:
                 f.write(decoded)
@@ -391,6 +492,10 @@ class QRDisplayHelper:
         return "\n".join(info_lines)
 
 
+# Shortest wait RateLimitHelper bothers sleeping for, in seconds
+_MIN_SLEEP = 0.0005
+
+
 class RateLimitHelper:
     """
     Helper for managing API rate limits during tests.
@@ -398,7 +503,8 @@ class RateLimitHelper:
 
     def __init__(self, default_delay: float = 1.0):
         self.default_delay = default_delay
-        self.last_request_time = 0.0
+        # Monotonic clock, so NTP adjustments can't stretch or skip a delay
+        self.last_request_time = float("-inf")
 
     def wait_if_needed(self, min_delay: float = None):
         """
@@ -408,12 +514,13 @@ class RateLimitHelper:
             min_delay: Minimum delay between requests
         """
         delay = min_delay or self.default_delay
-        elapsed = time.time() - self.last_request_time
+        remaining = delay - (time.monotonic() - self.last_request_time)
 
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
+        # Sub-millisecond waits would cost more in scheduler wake-up than they save
+        if remaining > _MIN_SLEEP:
+            time.sleep(remaining)
 
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     def with_rate_limit(self, func: Callable, *args, **kwargs):
         """
@@ -440,6 +547,7 @@ class TestInstanceManager:
         self.client = client
         self.prefix = prefix
         self.active_instances: Dict[str, Dict[str, Any]] = {}
+        self._instances_cache = _InstancesCache(client)
 
     def create_instance(self, name: str = None, qrcode: bool = True, **kwargs) -> Dict[str, Any]:
         """
@@ -454,7 +562,9 @@ class TestInstanceManager:
             Creation result dictionary
         """
         if not name:
-            name = f"{self.prefix}-{int(time.time())}"
+            # Worker suffix keeps pytest-xdist workers from colliding on the same name
+            worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+            name = f"{self.prefix}-{int(time.time())}-{worker}"
 
         try:
             # Clean up if exists
@@ -466,6 +576,7 @@ class TestInstanceManager:
 
             # Create instance
             response = self.client.instance.create(instance_name=name, qrcode=qrcode, **kwargs)
+            self._instances_cache.invalidate()
 
             # Track instance
             self.active_instances[name] = {
@@ -494,14 +605,11 @@ class TestInstanceManager:
             return None
 
         try:
-            # Get latest status from API
-            instances = self.client.instance.fetch_instances()
-
-            for instance in instances:
-                if instance.name == name or instance.id == name:
-                    self.active_instances[name]["current_status"] = instance.status
-                    self.active_instances[name]["current_state"] = getattr(instance, "state", None)
-                    break
+            # Get latest status from API (one fetch per polling tick)
+            instance = self._instances_cache.get(name)
+            if instance is not None:
+                self.active_instances[name]["current_status"] = instance.status
+                self.active_instances[name]["current_state"] = instance.state
 
             return self.active_instances[name]
 
@@ -511,6 +619,7 @@ class TestInstanceManager:
 
     def cleanup_all(self):
         """Clean up all managed instances."""
+        self._instances_cache.invalidate()
         for name in list(self.active_instances.keys()):
             try:
                 self.client.instance.delete(name)
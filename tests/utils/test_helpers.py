@@ -5,17 +5,29 @@ This module contains common test utilities that can be used across
 different test modules for mocking, assertions, and test data generation.
 """
 
+import functools
+import hashlib
+import itertools
+import os
+import pickle
+import tempfile
 import time
-import uuid
-from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from unittest.mock import Mock
 
+import httpx
 import pytest
 
 from pyevolutionapi import EvolutionClient
 from pyevolutionapi.models.instance import Instance, InstanceResponse, InstanceStatus
 from pyevolutionapi.models.message import MessageResponse
 
+# Per-process sequence for generate_test_instance_name
+_name_counter = itertools.count()
+
 
 def generate_test_instance_name(prefix: str = "test") -> str:
     """
@@ -25,18 +37,17 @@ def generate_test_instance_name(prefix: str = "test") -> str:
         prefix: Prefix for the instance name
 
     Returns:
-        Unique instance name with timestamp
+        Instance name unique within the process (counter) and across runs (random suffix)
     """
-    timestamp = int(time.time())
-    unique_id = str(uuid.uuid4())[:8]
-    return f"{prefix}-{timestamp}-{unique_id}"
+    # getpid() per call so forked workers don't share a prefix
+    return f"{prefix}-{os.getpid()}-{next(_name_counter)}-{os.urandom(3).hex()}"
 
 
 def mock_evolution_response(
     status: str = "success", data: Optional[Dict[str, Any]] = None, status_code: int = 200
-) -> Mock:
+) -> httpx.Response:
     """
-    Create a mock HTTP response for Evolution API.
+    Create an HTTP response for Evolution API.
 
     Args:
         status: Response status
@@ -44,20 +55,22 @@ def mock_evolution_response(
         status_code: HTTP status code
 
     Returns:
-        Mock response object
+        httpx.Response with the JSON body
     """
-    response = Mock()
-    response.status_code = status_code
-    response.is_success = status_code < 400
-
     response_data = {"status": status}
     if data:
         response_data.update(data)
 
-    response.json.return_value = response_data
-    response.text = str(response_data)
+    return httpx.Response(status_code, json=response_data)
 
-    return response
+
+# QR code payloads used by mock_instance_response and TestDataFactory (include_qr=True)
+_MOCK_QR_CODE: Dict[str, Any] = {
+    "base64": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAMgAAADI...",
+    "count": 0,
+    "url": "https://web.whatsapp.com/qr/123456",
+}
+_FACTORY_QR_CODE: Dict[str, Any] = {"base64": "data:image/png;base64,mock_qr_data", "count": 0}
 
 
 def mock_instance_data(
@@ -117,20 +130,32 @@ def mock_instance_response(
     }
 
     if include_qr:
-        response["qrcode"] = {
-            "base64": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAMgAAADI...",
-            "count": 0,
-            "url": "https://web.whatsapp.com/qr/123456",
-        }
+        # Copied: callers get a plain dict they are free to modify
+        response["qrcode"] = dict(_MOCK_QR_CODE)
 
     return response
 
 
+# Instance statuses a live response may report (DELETED never comes back from the API)
+_VALID_INSTANCE_STATUSES = frozenset(
+    {
+        InstanceStatus.CREATED,
+        InstanceStatus.CONNECTING,
+        InstanceStatus.CONNECTED,
+        InstanceStatus.DISCONNECTED,
+    }
+)
+
+# Default attribute names a response may carry its QR code under, in lookup order
+_QR_ATTRS: Tuple[str, ...] = ("qr_code_base64", "qrcode", "qr")
+
+
 def assert_evolution_response(
     response: Any,
     expected_status: Optional[str] = None,
     should_have_instance: bool = False,
     should_have_qr: bool = False,
+    qr_fields: Tuple[str, ...] = _QR_ATTRS,
 ):
     """
     Assert Evolution API response structure.
@@ -140,6 +165,7 @@ def assert_evolution_response(
         expected_status: Expected status value
         should_have_instance: Whether response should have instance
         should_have_qr: Whether response should have QR code
+        qr_fields: Attribute names checked, in order, for QR code data
     """
     # Basic response validation
     assert response is not None, "Response should not be None"
@@ -152,23 +178,12 @@ def assert_evolution_response(
         assert response.instance is not None, "Instance should not be None"
 
         if hasattr(response.instance, "status"):
-            assert response.instance.status in [
-                InstanceStatus.CREATED,
-                InstanceStatus.CONNECTING,
-                InstanceStatus.CONNECTED,
-                InstanceStatus.DISCONNECTED,
-            ], f"Invalid instance status: {response.instance.status}"
+            status = response.instance.status
+            assert status in _VALID_INSTANCE_STATUSES, f"Invalid instance status: {status}"
 
     if should_have_qr:
-        qr_found = False
-
         # Check different QR field variations
-        if hasattr(response, "qr_code_base64") and response.qr_code_base64:
-            qr_found = True
-        elif hasattr(response, "qrcode") and response.qrcode:
-            qr_found = True
-        elif hasattr(response, "qr") and response.qr:
-            qr_found = True
+        qr_found = any(getattr(response, field, None) for field in qr_fields)
 
         assert qr_found, "Response should contain QR code data"
 
@@ -178,15 +193,22 @@ def wait_for_condition(
     timeout: float = 30.0,
     interval: float = 1.0,
     error_message: str = "Condition not met within timeout",
+    min_interval: float = 0.01,
+    backoff: float = 2.0,
 ) -> bool:
     """
     Wait for a condition to become true.
 
+    Checks start ``min_interval`` apart and back off by ``backoff`` up to ``interval``,
+    so conditions that resolve quickly are noticed within milliseconds.
+
     Args:
         condition_func: Function that returns True when condition is met
         timeout: Maximum time to wait in seconds
-        interval: Check interval in seconds
+        interval: Maximum check interval in seconds
         error_message: Error message if timeout
+        min_interval: First check interval in seconds
+        backoff: Factor the check interval grows by after each failed check
 
     Returns:
         True if condition met, False if timeout
@@ -194,20 +216,104 @@ def wait_for_condition(
     Raises:
         TimeoutError: If condition not met within timeout
     """
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    delay = min(min_interval, interval)
 
-    while time.time() - start_time < timeout:
+    while True:
         try:
             if condition_func():
                 return True
         except Exception:
             pass  # Ignore exceptions in condition function
 
-        time.sleep(interval)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        time.sleep(min(delay, remaining))
+        delay = min(delay * backoff, interval)
 
     raise TimeoutError(error_message)
 
 
+# On-disk cache used by debug_caching (only when DEBUG_CACHING is set)
+DEBUG_CACHE_PATH = Path(tempfile.gettempdir()) / "pyevolution_debug_cache.pickle"
+
+
+def debug_caching(func: Callable) -> Callable:
+    """
+    Persist a function's results on disk between pytest runs.
+
+    Only active when the DEBUG_CACHING environment variable is set, so that
+    local reruns of the integration/E2E suites can skip deterministic,
+    read-only calls to the real API. Without it the function is called as
+    usual. Delete DEBUG_CACHE_PATH to refresh the cached values.
+
+    Args:
+        func: Function whose positional arguments identify the result
+
+    Returns:
+        Wrapped function
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        if not os.getenv("DEBUG_CACHING"):
+            return func(*args)
+
+        # Hash the arguments so credentials are never written to disk
+        digest = hashlib.sha256(repr(args).encode()).hexdigest()
+        key = f"{func.__module__}.{func.__qualname__}:{digest}"
+
+        try:
+            with open(DEBUG_CACHE_PATH, "rb") as f:
+                cache = pickle.load(f)
+        except (OSError, EOFError, pickle.PickleError):
+            cache = {}
+
+        if key not in cache:
+            cache[key] = func(*args)
+            with open(DEBUG_CACHE_PATH, "wb") as f:
+                pickle.dump(cache, f)
+
+        return cache[key]
+
+    return wrapper
+
+
+# Clients handed out by real_api_client, closed by close_real_api_clients
+_real_api_clients: List[EvolutionClient] = []
+
+
+@functools.lru_cache(maxsize=None)
+def real_api_client(base_url: str, api_key: str) -> EvolutionClient:
+    """
+    Build the real Evolution API client once per (base_url, api_key).
+
+    Args:
+        base_url: Evolution API base URL
+        api_key: Evolution API key
+
+    Returns:
+        Client shared by every caller with the same configuration
+    """
+    client = EvolutionClient(
+        base_url=base_url,
+        api_key=api_key,
+        timeout=60.0,  # Real API calls can be slow
+        debug=True,
+    )
+    _real_api_clients.append(client)
+    return client
+
+
+def close_real_api_clients() -> None:
+    """Close every client built by real_api_client and forget them."""
+    while _real_api_clients:
+        _real_api_clients.pop().close()
+    real_api_client.cache_clear()
+
+
 def cleanup_test_instances(client: EvolutionClient, pattern: str = "test-"):
     """
     Clean up test instances that match a pattern.
@@ -218,67 +324,121 @@ def cleanup_test_instances(client: EvolutionClient, pattern: str = "test-"):
     """
     try:
         instances = client.instance.fetch_instances()
+    except Exception:
+        return  # Ignore if fetch fails
 
-        for instance in instances:
-            instance_name = instance.name or instance.id
-            if instance_name and pattern in instance_name:
-                try:
-                    client.instance.delete(instance_name)
-                except Exception:
-                    pass  # Ignore cleanup errors
+    names = [name for name in (i.name or i.id for i in instances) if name and pattern in name]
+    if not names:
+        return
 
-    except Exception:
-        pass  # Ignore if fetch fails
+    def delete(instance_name: str) -> None:
+        try:
+            client.instance.delete(instance_name)
+        except Exception:
+            pass  # Ignore cleanup errors
+
+    # The API has no batch delete endpoint; overlap the round-trips on the pooled client
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+        list(executor.map(delete, names))
+
+
+def _stub(return_value: Any) -> Callable[..., Any]:
+    """Build a function that ignores its arguments and returns ``return_value``."""
+
+    def stub(*args: Any, **kwargs: Any) -> Any:
+        return return_value
+
+    return stub
 
 
 class MockEvolutionClient:
     """
     Mock Evolution API client for testing.
+
+    With ``record=False`` the resources are plain namespaces of stub functions
+    returning the default responses: much cheaper to build, but without call
+    recording or auto-created attributes.
     """
 
-    def __init__(self):
-        self.instance = Mock()
-        self.messages = Mock()
-        self.chat = Mock()
-        self.group = Mock()
-        self.profile = Mock()
-        self.webhook = Mock()
+    def __init__(self, record: bool = True):
+        self.record = record
+        resource = Mock if record else SimpleNamespace
+        self.instance = resource()
+        self.messages = resource()
+        self.chat = resource()
+        self.group = resource()
+        self.profile = resource()
+        self.webhook = resource()
 
         # Setup default responses
-        self._setup_default_responses()
-
-    def _setup_default_responses(self):
+        self._setup_default_responses(record)
+
+    def reset_mock(self):
+        """Forget recorded calls and overrides, restoring the default responses."""
+        if self.record:
+            for resource in (
+                self.instance,
+                self.messages,
+                self.chat,
+                self.group,
+                self.profile,
+                self.webhook,
+            ):
+                resource.reset_mock(return_value=True, side_effect=True)
+        self._setup_default_responses(self.record)
+
+    def _setup_default_responses(self, record: bool = True):
         """Setup default mock responses."""
-
-        # Instance operations
-        self.instance.create.return_value = InstanceResponse(
-            status="success",
-            instance=Instance(
-                instance_name="test-instance",
-                instance_id="test-id",
-                status=InstanceStatus.CONNECTING,
+        defaults = [
+            # Instance operations
+            (
+                self.instance,
+                "create",
+                InstanceResponse(
+                    status="success",
+                    instance=Instance(
+                        instance_name="test-instance",
+                        instance_id="test-id",
+                        status=InstanceStatus.CONNECTING,
+                    ),
+                    hash="test-hash",
+                ),
             ),
-            hash="test-hash",
-        )
-
-        self.instance.fetch_instances.return_value = [
-            Instance(
-                id="test-id",
-                name="test-instance",
-                status=InstanceStatus.CONNECTED,
-                integration="WHATSAPP-BAILEYS",
-            )
+            (
+                self.instance,
+                "fetch_instances",
+                [
+                    Instance(
+                        id="test-id",
+                        name="test-instance",
+                        status=InstanceStatus.CONNECTED,
+                        integration="WHATSAPP-BAILEYS",
+                    )
+                ],
+            ),
+            (
+                self.instance,
+                "connection_state",
+                {
+                    "state": "open",
+                    "instance": {"instanceName": "test-instance", "state": "open"},
+                },
+            ),
+            # Message operations
+            (self.messages, "send_text", MessageResponse(status="success", message_id="msg_123")),
         ]
 
-        self.instance.connection_state.return_value = {
-            "state": "open",
-            "instance": {"instanceName": "test-instance", "state": "open"},
-        }
+        for resource, method, value in defaults:
+            if not record:
+                setattr(resource, method, _stub(value))
+                continue
 
-        # Message operations
-        self.messages.send_text.return_value = MessageResponse(
-            status="success", message_id="msg_123"
-        )
+            mock_method = getattr(resource, method)
+            if not isinstance(mock_method, Mock):
+                # A test replaced the method outright; put a mock back
+                mock_method = Mock()
+                setattr(resource, method, mock_method)
+            mock_method.return_value = value
 
 
 class TestDataFactory:
@@ -291,13 +451,14 @@ class TestDataFactory:
         name: str = None, status: InstanceStatus = InstanceStatus.CONNECTING, **kwargs
     ) -> Instance:
         """Create a test Instance object."""
+        suffix = name or "test"
         return Instance(
-            id=kwargs.get("id", f"id_{name or 'test'}"),
+            id=kwargs.pop("id", f"id_{suffix}"),
             name=name or "test-instance",
-            instance_id=kwargs.get("instance_id", f"inst_{name or 'test'}"),
+            instance_id=kwargs.pop("instance_id", f"inst_{suffix}"),
             status=status,
-            integration=kwargs.get("integration", "WHATSAPP-BAILEYS"),
-            **{k: v for k, v in kwargs.items() if k not in ["id", "instance_id", "integration"]},
+            integration=kwargs.pop("integration", "WHATSAPP-BAILEYS"),
+            **kwargs,
         )
 
     @staticmethod
@@ -318,7 +479,8 @@ class TestDataFactory:
         }
 
         if include_qr:
-            response_data["qrcode"] = {"base64": "data:image/png;base64,mock_qr_data", "count": 0}
+            # Validation copies the dict into the model, so the constant is never shared
+            response_data["qrcode"] = _FACTORY_QR_CODE
 
         return InstanceResponse(**response_data)
 
@@ -328,17 +490,11 @@ class TestDataFactory:
     ) -> MessageResponse:
         """Create a test MessageResponse object."""
         return MessageResponse(
-            status=status, message_id=message_id or f"msg_{int(time.time())}", **kwargs
+            status=status, message_id=message_id or f"msg_{time.monotonic_ns()}", **kwargs
         )
 
 
 # Pytest fixtures that can be used across tests
-@pytest.fixture
-def mock_client():
-    """Fixture providing a mock Evolution client."""
-    return MockEvolutionClient()
-
-
 @pytest.fixture
 def test_instance_name():
     """Fixture providing a unique test instance name."""
@@ -351,22 +507,8 @@ def test_data_factory():
     return TestDataFactory
 
 
-# Markers for better test categorization
-def slow_test(func):
-    """Mark test as slow (for tests that take longer)."""
-    return pytest.mark.slow(func)
-
-
-def integration_test(func):
-    """Mark test as integration test."""
-    return pytest.mark.integration(func)
-
-
-def requires_api(func):
-    """Mark test as requiring real API."""
-    return pytest.mark.requires_api(func)
-
-
-def requires_whatsapp(func):
-    """Mark test as requiring WhatsApp connection."""
-    return pytest.mark.requires_whatsapp(func)
+# Markers for better test categorization (usable directly as decorators)
+slow_test = pytest.mark.slow  # Tests that take longer
+integration_test = pytest.mark.integration
+requires_api = pytest.mark.requires_api  # Needs the real Evolution API
+requires_whatsapp = pytest.mark.requires_whatsapp  # Needs a WhatsApp connection